@@ -10,23 +10,297 @@ Usage:
 """
 
 import argparse
+import csv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import os
+import sys
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 import time
 import re
+import shutil
+import threading
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
+logger = logging.getLogger("wikijs_exporter")
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON (de)serialization, stdlib json is used otherwise
+    orjson = None
+
+
+# HTTP connection pool (sized to the number of concurrent workers)
+HTTP_POOL_SIZE = 32
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Worker threads for independent GraphQL requests (folders, page contents)
+MAX_WORKERS = 16
+
+# Parent folders queried per aliased GraphQL request (bounded by server query size limits)
+FOLDER_BATCH_SIZE = 25
+
+# Pages fetched per batched GraphQL request
+PAGE_BATCH_SIZE = 20
+
+# Page content requests allowed per second across all workers (burst up to MAX_WORKERS)
+PAGE_REQUESTS_PER_SECOND = 20
+
+# Per-wiki record of the working endpoint, auth method and query shapes,
+# so repeated runs into the same output directory skip the probing
+CACHE_FILENAME = '.exporter_cache.json'
+
+# URL prefixes an asset may be served under, relative to the wiki root
+# (the direct path works on standard WikiJS; /a returns the HTML asset page)
+ASSET_URL_PREFIXES = ['', '/a', '/assets', '/uploads', '/files', '/content', '/media', '/static']
+
+# Read size when streaming asset downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Suffix of an asset file while it is being downloaded
+PARTIAL_DOWNLOAD_SUFFIX = '.part'
+
+# Cheapest query that only succeeds on a working endpoint with accepted auth
+TEST_CONNECTION_QUERY = """
+query TestConnection {
+  __schema {
+    queryType {
+      name
+    }
+  }
+}
+"""
+
+# Page content query, parameterized so batched operations share one query document
+PAGE_CONTENT_FIELDS = """
+      id
+      path
+      title
+      description
+      content
+      contentType
+      isPublished
+      locale
+      createdAt
+      updatedAt
+      editor
+"""
+
+GET_PAGE_CONTENT = f"""
+query GetPageContent($id: Int!) {{
+  pages {{
+    single(id: $id) {{{PAGE_CONTENT_FIELDS}    }}
+  }}
+}}
+"""
+
+# Fallback page content queries for older or differently shaped schemas
+GET_SINGLE_PAGE = f"""
+query GetSinglePage($id: Int!) {{
+  page(id: $id) {{{PAGE_CONTENT_FIELDS}  }}
+}}
+"""
+
+PAGE_PATH_FIELDS = """
+      id
+      path
+      title
+      content
+      contentType
+      isPublished
+      locale
+"""
+
+GET_PAGE_BY_PATH = f"""
+query GetPageByPath($path: String!) {{
+  pages {{
+    single(path: $path) {{{PAGE_PATH_FIELDS}    }}
+  }}
+}}
+"""
+
+GET_PAGE_BY_PATH2 = f"""
+query GetPageByPath2($path: String!) {{
+  page(path: $path) {{{PAGE_PATH_FIELDS}  }}
+}}
+"""
+
+# Folder and asset queries
+GET_SUBFOLDERS = """
+query GetSubfolders($parentFolderId: Int!) {
+  assets {
+    folders(parentFolderId: $parentFolderId) {
+      id
+      name
+      slug
+    }
+  }
+}
+"""
+
+DISCOVER_ASSET_TYPES = """
+query DiscoverAssetTypes($folderId: Int!) {
+  assets {
+    list(folderId: $folderId) {
+      kind
+      filename
+      ext
+      mime
+    }
+  }
+}
+"""
+
+ASSET_FIELDS = """
+      id
+      filename
+      ext
+      kind
+      mime
+      fileSize
+      folder {
+        name
+      }
+"""
+
+GET_FOLDER_ASSETS = f"""
+query GetAllAssetsFromFolder($folderId: Int!) {{
+  assets {{
+    list(folderId: $folderId) {{{ASSET_FIELDS}    }}
+  }}
+}}
+"""
+
+GET_FOLDER_ASSETS_BY_KIND = f"""
+query GetAssetsFromFolder($folderId: Int!, $kind: AssetKind!) {{
+  assets {{
+    list(folderId: $folderId, kind: $kind) {{{ASSET_FIELDS}    }}
+  }}
+}}
+"""
+
+# File extensions treated as downloadable attachments in links, and
+# additionally image extensions for src= attributes
+_FILE_EXTS = 'xml|txt|csv|json|pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|yaml|yml|drawio'
+_IMAGE_EXTS = 'jpg|jpeg|png|gif|svg|webp'
+
+# Asset references in page content; each pattern captures the URL in its only
+# group. They are scanned one by one, since one alternation would not report
+# references inside another match (an <img> tag as the text of a file link, or
+# a tag after a stray '[')
+_ASSET_RES = tuple(re.compile(pattern) for pattern in (
+    r'!\[[^\]]*\]\(([^)]+)\)',  # Markdown images
+    r'<img[^>]+?src=["\']([^"\']+)["\']',  # HTML img tags
+    rf'\[[^\]]*\]\(([^)]+\.(?:{_FILE_EXTS})(?:\s*=[^)]*)?)\)',  # Markdown links to files
+    rf'<a[^>]+href=["\']([^"\']+\.(?:{_FILE_EXTS})(?:\s*=[^"\']*)?)["\']',  # HTML links to files
+    # Remaining src/href attributes with file extensions in any other context
+    rf'src=["\']([^"\']*\.(?:{_IMAGE_EXTS}|{_FILE_EXTS})(?:\s*=[^"\']*)?)["\']',
+    rf'href=["\']([^"\']*\.(?:{_FILE_EXTS})(?:\s*=[^"\']*)?)["\']',
+))
+
+# Page frontmatter (same format as WikiJS git export); every line except
+# 'published' is optional and left out when its value is empty
+_FRONTMATTER_TEMPLATE = '---\n{title}{description}published: {published}\n{date}{tags}{editor}{created}---\n\n'
+
+# WikiJS image size suffix appended to asset links: =500x300, =500x, =40%x, =70%, =500
+_SIZE_RE = re.compile(r'\s*=\d+%?(?:x\d*%?)?\s*$')
+
+
+# Asset URLs repeat across pages (logos, banners), so their cleaning and host
+# parsing are memoized
+ASSET_URL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ASSET_URL_CACHE_SIZE)
+def _clean_asset_url(asset_url: str) -> str:
+    """Decode an asset URL and strip its WikiJS size suffix"""
+    return _SIZE_RE.sub('', urllib.parse.unquote(asset_url))
+
+
+@lru_cache(maxsize=ASSET_URL_CACHE_SIZE)
+def _url_host(url: str) -> str:
+    """Lowercased host (netloc) of a URL"""
+    return urllib.parse.urlparse(url).netloc.lower()
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available, same output either way)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _RateLimiter:
+    """Token bucket shared between worker threads; a rate of 0 or less means no limit"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
 class WikiJSGraphQLExporter:
     def __init__(self, wiki_url: str, api_token: str, output_dir: str, assets_only: bool = False):
         self.wiki_url = wiki_url.rstrip('/')
+        self._wiki_netloc = urllib.parse.urlparse(self.wiki_url).netloc.lower()
+        self._wiki_netloc_dot = '.' + self._wiki_netloc  # Suffix matching subdomains of the wiki
         self.api_token = api_token
         self.output_dir = Path(output_dir)
         self.assets_only = assets_only
         self.session = requests.Session()
+
+        # Pooled connections + retry with backoff on transient server errors.
+        # GraphQL reads are POSTs, so POST is retried as well.
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                allowed_methods=["HEAD", "GET", "POST"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Multiple authentication methods to try
         self.auth_headers = [
@@ -47,32 +321,144 @@ class WikiJSGraphQLExporter:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Track what we've downloaded
-        self.downloaded_assets: Set[str] = set()
         self.successfully_downloaded: Set[str] = set()  # Track actually downloaded files
+        self._existing_files: frozenset = frozenset()  # Files already in output_dir when the export started
         self.failed_downloads: Dict[str, List[str]] = {}  # asset_path -> list of reasons
-        self.asset_to_pages: Dict[str, List[str]] = {}  # asset_path -> list of page paths that reference it
-        self.exported_pages: List[Dict] = []
+        # asset_path -> names of the pages that reference it; its keys are the
+        # asset paths found in content and queued for download
+        self.asset_to_pages: Dict[str, Set[str]] = defaultdict(set)
+        self.exported_pages: List[Dict] = []  # title/path/id of each saved page, for the manifest
+
+        # Paces page content requests across all fetch workers
+        self._page_rate_limiter = _RateLimiter(PAGE_REQUESTS_PER_SECOND, MAX_WORKERS)
+
+        # How this server accepts batched page content queries: 'array', 'alias' or 'single'
+        self._page_batch_mode: Optional[str] = None
+
+        # Whether assets can be listed without a kind filter (None = not known yet)
+        self._kindless_supported: Optional[bool] = None
+
+        # Whether all kinds of a folder can be listed in one aliased query (None = not known yet)
+        self._kind_batch_supported: Optional[bool] = None
+
+        # Raw responses of schema, folder and probe queries by (query, variables), so
+        # repeated reads are not re-sent; page contents and lists are never kept
+        self._gql_responses: Dict[Tuple[str, Tuple], bytes] = {}
+
+        # Asset URL prefix that served the last successful download (None = not known yet)
+        self._asset_prefix: Optional[str] = None
+
+        # Working setup remembered from a previous run (never contains the token)
+        self._cache_file = self.output_dir / CACHE_FILENAME
+        self._cache = self._load_cache()
+        self._auth_method: Optional[int] = None
+        self._pages_query_idx: Optional[int] = self._cache.get('pages_query_idx')
+
+        # Index of the page content query shape this server answers (None = not known yet)
+        self._content_query_idx: Optional[int] = self._cache.get('content_query_idx')
         
         
         print(f"WikiJS GraphQL Exporter initialized")
         print(f"Wiki URL: {self.wiki_url}")
         print(f"Output: {self.output_dir}")
     
+    def _load_cache(self) -> Dict:
+        """Load the cached setup for this wiki, if any"""
+        try:
+            with open(self._cache_file, 'rb') as f:
+                entry = _json_loads(f.read()).get(self.wiki_url)
+            return entry if isinstance(entry, dict) else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_cache(self):
+        """Persist the working endpoint, auth method and query shapes for this wiki"""
+        try:
+            with open(self._cache_file, 'rb') as f:
+                cache = _json_loads(f.read())
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+
+        cache[self.wiki_url] = {
+            'graphql_url': self.graphql_url,
+            'auth_method': self._auth_method,
+            'pages_query_idx': self._pages_query_idx,
+            'content_query_idx': self._content_query_idx,
+        }
+
+        try:
+            with open(self._cache_file, 'wb') as f:
+                f.write(_json_dumps(cache))
+        except OSError as e:
+            print(f"  Could not save exporter cache: {e}")
+
+    def _use_cached_connection(self) -> bool:
+        """Apply the endpoint and auth method that worked on a previous run"""
+        graphql_url = self._cache.get('graphql_url')
+        auth_method = self._cache.get('auth_method')
+
+        if not graphql_url or not isinstance(auth_method, int) or not 0 <= auth_method < len(self.auth_headers):
+            return False
+
+        # Confirm the cached setup still works before anything (like the background
+        # asset listing) relies on it; otherwise the full probe runs
+        print(f"\nChecking cached GraphQL setup: {graphql_url} (auth method {auth_method+1})")
+        try:
+            response = self._post_graphql({'query': TEST_CONNECTION_QUERY}, graphql_url,
+                                          headers=self.auth_headers[auth_method], timeout=10)
+            result = _json_loads(response.content) if response.status_code == 200 else None
+            works = isinstance(result, dict) and '__schema' in (result.get('data') or {})
+        except Exception as e:
+            print(f"  Exception: {e}")
+            works = False
+        if not works:
+            print("  Cached setup no longer works, probing again...")
+            return False
+
+        print("  ✓ Using cached GraphQL setup")
+        self.graphql_url = graphql_url
+        self._auth_method = auth_method
+        self.session.headers.update(self.auth_headers[auth_method])
+        return True
+
+    def _post_graphql(self, payload: Any, endpoint: Optional[str] = None, **kwargs) -> requests.Response:
+        """POST a GraphQL payload (one operation or a batch list) serialized as JSON"""
+        return self.session.post(endpoint or self.graphql_url, data=_json_dumps(payload), **kwargs)
+
+    def _gql(self, query: str, variables: Optional[Dict] = None, cache: bool = False) -> Dict:
+        """Run one GraphQL operation and return the parsed response body
+
+        With cache=True the raw response is kept for the rest of the run; only
+        small, repeated reads (schema, folders, probes) should use it.
+        """
+        content = None
+        if cache:
+            key = (query, tuple(sorted(variables.items())) if variables else ())
+            content = self._gql_responses.get(key)
+        if content is None:
+            payload = {'query': query}
+            if variables:
+                payload['variables'] = variables
+
+            response = self._post_graphql(payload)
+
+            # GraphQL servers report query validation errors as HTTP 400 with a JSON error body
+            if response.status_code not in (200, 400):
+                raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+
+            content = response.content
+            if cache:
+                self._gql_responses[key] = content
+
+        # Parsed fresh on every call, since callers modify the returned dicts
+        return _json_loads(content)
+
     def test_graphql_connection(self) -> bool:
         """Test GraphQL connection with different authentication methods"""
         print("\nTesting GraphQL API connection...")
         
-        # Simple introspection query to test connection
-        test_query = """
-        query TestConnection {
-          __schema {
-            queryType {
-              name
-            }
-          }
-        }
-        """
-        
         graphql_endpoints = [
             f"{self.wiki_url}/graphql",
             f"{self.wiki_url}/api/graphql",
@@ -84,23 +470,24 @@ class WikiJSGraphQLExporter:
             
             for i, auth_header in enumerate(self.auth_headers):
                 try:
-                    headers = {**self.session.headers, **auth_header}
-                    
-                    response = requests.post(
+                    # Session headers are merged in by requests; reusing the
+                    # session keeps the connection alive across attempts
+                    response = self._post_graphql(
+                        {'query': TEST_CONNECTION_QUERY},
                         endpoint,
-                        json={'query': test_query},
-                        headers=headers,
+                        headers=auth_header,
                         timeout=10
                     )
                     
                     print(f"  Auth method {i+1}: Status {response.status_code}")
                     
                     if response.status_code == 200:
-                        result = response.json()
+                        result = _json_loads(response.content)
                         if 'data' in result and '__schema' in result['data']:
                             print(f"  ✓ Connection successful with auth method {i+1}")
                             # Set working configuration
                             self.graphql_url = endpoint
+                            self._auth_method = i
                             self.session.headers.update(auth_header)
                             return True
                     elif response.status_code == 403:
@@ -118,23 +505,18 @@ class WikiJSGraphQLExporter:
     
     def get_full_schema(self) -> Dict:
         """Get the complete GraphQL schema to understand available operations"""
+        # Only the fields print_schema_structure reads are requested, which keeps
+        # the introspection response small on large schemas
         schema_query = """
         query IntrospectionQuery {
           __schema {
             queryType {
               fields {
                 name
-                description
                 args {
                   name
-                  description
                   type {
                     name
-                    kind
-                    ofType {
-                      name
-                      kind
-                    }
                   }
                 }
                 type {
@@ -144,26 +526,17 @@ class WikiJSGraphQLExporter:
                     name
                     type {
                       name
-                      kind
                     }
                   }
                 }
               }
             }
-            mutationType {
-              fields {
-                name
-                description
-              }
-            }
           }
         }
         """
         
         try:
-            response = self.session.post(self.graphql_url, json={'query': schema_query})
-            if response.status_code == 200:
-                return response.json().get('data', {})
+            return self._gql(schema_query, cache=True).get('data') or {}
         except Exception as e:
             print(f"Failed to get schema: {e}")
         
@@ -205,6 +578,28 @@ class WikiJSGraphQLExporter:
         
         # WikiJS specific queries based on common patterns
         queries_to_try.extend([
+            # Query 0: pages.list including content, which saves one content
+            # request per page on servers whose list type exposes it
+            """
+            query GetPagesListWithContent {
+              pages {
+                list {
+                  id
+                  path
+                  title
+                  description
+                  content
+                  contentType
+                  isPublished
+                  locale
+                  createdAt
+                  updatedAt
+                  editor
+                }
+              }
+            }
+            """,
+            
             # Query 1: Standard WikiJS pages.list structure
             """
             query GetPagesList {
@@ -319,10 +714,59 @@ class WikiJSGraphQLExporter:
         
         return queries_to_try
     
+    def _run_pages_query(self, query: str) -> List[Dict]:
+        """Run one candidate pages query and extract the page list from its response"""
+        try:
+            result = self._gql(query)
+            
+            if 'errors' in result:
+                print(f"GraphQL errors: {result['errors']}")
+                return []
+            
+            if 'data' in result:
+                data = result['data']
+                pages = []
+                
+                # Try to extract pages from different response structures
+                if 'pages' in data:
+                    pages_data = data['pages']
+                    
+                    if isinstance(pages_data, list):
+                        pages = pages_data
+                    elif isinstance(pages_data, dict):
+                        if 'list' in pages_data:
+                            pages = pages_data['list']
+                        else:
+                            pages = [pages_data]  # Single page object
+                
+                if pages:
+                    print(f"✓ Successfully retrieved {len(pages)} pages!")
+                    return pages
+                else:
+                    print(f"No pages found in response: {list(data.keys())}")
+
+        except Exception as e:
+            print(f"Query failed: {e}")
+
+        return []
+
     def fetch_all_pages(self) -> List[Dict]:
         """Fetch all pages using GraphQL with multiple query attempts"""
         print("\nFetching all pages via GraphQL...")
         
+        # Reuse the query that worked on a previous run, skipping introspection
+        if self._pages_query_idx is not None:
+            queries = self.find_pages_query_structure({})
+            if 0 <= self._pages_query_idx < len(queries):
+                print(f"Using cached pages query {self._pages_query_idx+1}/{len(queries)}")
+                pages = self._run_pages_query(queries[self._pages_query_idx])
+                if pages:
+                    return pages
+
+            # The connection itself was checked before the export started
+            print("Cached pages query failed, probing again...")
+            self._pages_query_idx = None
+        
         # Get schema information
         schema = self.get_full_schema()
         
@@ -333,45 +777,11 @@ class WikiJSGraphQLExporter:
             print(f"\nTrying pages query {i+1}/{len(queries)}...")
             print(f"Query preview: {query.strip()[:100]}...")
             
-            try:
-                response = self.session.post(self.graphql_url, json={'query': query})
-                
-                print(f"Response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if 'errors' in result:
-                        print(f"GraphQL errors: {result['errors']}")
-                        continue
-                    
-                    if 'data' in result:
-                        data = result['data']
-                        pages = []
-                        
-                        # Try to extract pages from different response structures
-                        if 'pages' in data:
-                            pages_data = data['pages']
-                            
-                            if isinstance(pages_data, list):
-                                pages = pages_data
-                            elif isinstance(pages_data, dict):
-                                if 'list' in pages_data:
-                                    pages = pages_data['list']
-                                else:
-                                    pages = [pages_data]  # Single page object
-                        
-                        if pages:
-                            print(f"✓ Successfully retrieved {len(pages)} pages!")
-                            return pages
-                        else:
-                            print(f"No pages found in response: {list(data.keys())}")
-                
-                else:
-                    print(f"HTTP Error: {response.text[:200]}")
-                    
-            except Exception as e:
-                print(f"Query failed: {e}")
+            pages = self._run_pages_query(query)
+            if pages:
+                self._pages_query_idx = i
+                self._save_cache()
+                return pages
         
         print("✗ All page queries failed")
         return []
@@ -380,114 +790,140 @@ class WikiJSGraphQLExporter:
         """Fetch full content for a specific page"""
         # Multiple query patterns for getting individual page content
         queries = [
-            # WikiJS standard single page query
-            f"""
-            query GetPageContent {{
-              pages {{
-                single(id: {page_id}) {{
-                  id
-                  path
-                  title
-                  description
-                  content
-                  contentType
-                  isPublished
-                  locale
-                  createdAt
-                  updatedAt
-                  editor
-                }}
-              }}
-            }}
-            """,
-            
-            # Alternative single page structure
-            f"""
-            query GetSinglePage {{
-              page(id: {page_id}) {{
-                id
-                path
-                title
-                description
-                content
-                contentType
-                isPublished
-                locale
-                createdAt
-                updatedAt
-                editor
-              }}
-            }}
-            """,
-            
-            # By path query
-            f"""
-            query GetPageByPath {{
-              pages {{
-                single(path: "{page_path}") {{
-                  id
-                  path
-                  title
-                  content
-                  contentType
-                  isPublished
-                  locale
-                }}
-              }}
-            }}
-            """,
-            
-            # Simple path query
-            f"""
-            query GetPageByPath2 {{
-              page(path: "{page_path}") {{
-                id
-                path
-                title
-                content
-                contentType
-                isPublished
-                locale
-              }}
-            }}
-            """
+            (GET_PAGE_CONTENT, {'id': int(page_id)}),   # WikiJS standard single page query
+            (GET_SINGLE_PAGE, {'id': int(page_id)}),    # Alternative single page structure
+            (GET_PAGE_BY_PATH, {'path': page_path}),    # By path query
+            (GET_PAGE_BY_PATH2, {'path': page_path}),   # Simple path query
         ]
         
-        for i, query in enumerate(queries, 1):
+        # Once a query shape has worked, every other page tries the same one first;
+        # the others remain as fallbacks for pages it does not return
+        candidates = list(enumerate(queries))
+        if self._content_query_idx is not None and 0 <= self._content_query_idx < len(queries):
+            candidates.insert(0, candidates.pop(self._content_query_idx))
+        
+        for idx, (query, variables) in candidates:
             try:
-                print(f"    Trying content query {i} for page {page_id}")
-                response = self.session.post(self.graphql_url, json={'query': query})
+                logger.debug("    Trying content query %s for page %s", idx+1, page_id)
+                result = self._gql(query, variables)
                 
-                if response.status_code == 200:
-                    result = response.json()
+                if 'errors' in result:
+                    logger.debug("      GraphQL errors: %s", result['errors'])
+                    continue
+                
+                if 'data' in result:
+                    data = result['data']
                     
-                    if 'errors' in result:
-                        print(f"      GraphQL errors: {result['errors']}")
-                        continue
+                    # Try different response structures
+                    page_data = None
+                    if 'pages' in data and data['pages'] and 'single' in data['pages']:
+                        page_data = data['pages']['single']
+                    elif 'page' in data and data['page']:
+                        page_data = data['page']
                     
-                    if 'data' in result:
-                        data = result['data']
-                        
-                        # Try different response structures
-                        page_data = None
-                        if 'pages' in data and data['pages'] and 'single' in data['pages']:
-                            page_data = data['pages']['single']
-                        elif 'page' in data and data['page']:
-                            page_data = data['page']
-                        
-                        if page_data:
-                            print(f"      ✓ Got content for page {page_id}")
-                            return page_data
-                        else:
-                            print(f"      No page data in response: {list(data.keys())}")
-                else:
-                    print(f"      HTTP {response.status_code}: {response.text[:100]}")
-                        
+                    if page_data:
+                        logger.debug("      ✓ Got content for page %s", page_id)
+                        self._content_query_idx = idx
+                        return page_data
+                    else:
+                        logger.debug("      No page data in response: %s", list(data.keys()))
+
             except Exception as e:
-                print(f"      Exception: {e}")
+                logger.warning("      Exception: %s", e)
         
         return None
     
+    def _fetch_pages_array_batch(self, page_ids: List[int]) -> Optional[List[Optional[Dict]]]:
+        """Fetch pages with a graphql-over-http array batch; None if batching is unsupported"""
+        payload = [{'query': GET_PAGE_CONTENT, 'variables': {'id': page_id}} for page_id in page_ids]
+        response = self._post_graphql(payload)
+
+        if response.status_code != 200:
+            return None
+
+        result = _json_loads(response.content)
+        if not isinstance(result, list) or len(result) != len(page_ids):
+            return None
+
+        pages = []
+        for item in result:
+            data = (item or {}).get('data') or {}
+            pages.append((data.get('pages') or {}).get('single'))
+        return pages
+
+    def _fetch_pages_alias_batch(self, page_ids: List[int]) -> Optional[List[Optional[Dict]]]:
+        """Fetch pages with one aliased query; None if the query failed as a whole"""
+        variables = {f"p{i}": page_id for i, page_id in enumerate(page_ids)}
+        params = ', '.join(f"${name}: Int!" for name in variables)
+        aliases = ''.join(
+            f"\n    {name}: single(id: ${name}) {{{PAGE_CONTENT_FIELDS}    }}" for name in variables
+        )
+        query = f"query GetPageContentBatch({params}) {{\n  pages {{{aliases}\n  }}\n}}"
+
+        response = self._post_graphql({'query': query, 'variables': variables})
+
+        if response.status_code != 200:
+            return None
+
+        data = _json_loads(response.content).get('data') or {}
+        pages_data = data.get('pages')
+        if not pages_data:
+            return None
+
+        return [pages_data.get(name) for name in variables]
+
+    def fetch_pages_batch(self, page_refs: List[Tuple[int, str]]) -> List[Optional[Dict]]:
+        """Fetch full content for several pages, using request batching when the server supports it"""
+        page_ids = [int(page_id) for page_id, _ in page_refs]
+        pages: Optional[List[Optional[Dict]]] = None
+
+        try:
+            if self._page_batch_mode in (None, 'array'):
+                pages = self._fetch_pages_array_batch(page_ids)
+                if pages is not None:
+                    self._page_batch_mode = 'array'
+                elif self._page_batch_mode is None:
+                    print("    Array batching not supported, trying aliased batch query")
+
+            if pages is None and self._page_batch_mode in (None, 'alias'):
+                pages = self._fetch_pages_alias_batch(page_ids)
+                if pages is not None:
+                    self._page_batch_mode = 'alias'
+                elif self._page_batch_mode is None:
+                    print("    Batched page queries not supported, fetching pages one by one")
+                    self._page_batch_mode = 'single'
+
+        except Exception as e:
+            print(f"    Batched page fetch failed: {e}")
+
+        if pages is None:
+            pages = [None] * len(page_refs)
+
+        # Pages the batch could not deliver go through the per-page query probes
+        for i, (page_id, page_path) in enumerate(page_refs):
+            if not pages[i]:
+                pages[i] = self.fetch_page_content(page_id, page_path)
+
+        return pages
+
+    def _fetch_page_batch(self, pages: List[Dict]) -> List[Dict]:
+        """Fill in the content of pages the pages list returned without it"""
+        missing = [page for page in pages if not page.get('content') and page.get('id')]
+
+        if missing:
+            # Rate limiting
+            self._page_rate_limiter.acquire()
+
+            try:
+                page_refs = [(page['id'], page.get('path', f"page_{page['id']}")) for page in missing]
+                for page, full_page in zip(missing, self.fetch_pages_batch(page_refs)):
+                    if full_page:
+                        page.update(full_page)
+            except Exception as e:
+                print(f"  ✗ Failed to fetch page contents: {e}")
+
+        return pages
+
     def fetch_assets_list(self) -> List[Dict]:
         """Fetch list of all assets/attachments"""
         print("\nFetching assets list...")
@@ -499,60 +935,98 @@ class WikiJSGraphQLExporter:
         print(f"\nStep 2: Getting assets from all {len(folders)} folders...")
         return self.get_all_assets_from_folders(folders)
     
+    def _query_subfolders(self, parent_id: int) -> List[Dict]:
+        """Get the direct subfolders of a folder"""
+        try:
+            result = self._gql(GET_SUBFOLDERS, {'parentFolderId': parent_id}, cache=True)
+
+            if 'data' in result and 'assets' in result['data'] and 'folders' in result['data']['assets']:
+                return result['data']['assets']['folders']
+
+        except Exception as e:
+            print(f"  Failed to get subfolders of {parent_id}: {e}")
+
+        return []
+
+    def _batch_subfolders(self, parent_ids: List[int]) -> Dict[int, List[Dict]]:
+        """Get the direct subfolders of several folders with one aliased query"""
+        variables = {f"p{i}": parent_id for i, parent_id in enumerate(parent_ids)}
+        params = ', '.join(f"${name}: Int!" for name in variables)
+        aliases = '\n'.join(
+            f"f{i}: folders(parentFolderId: $p{i}) {{ id name slug }}" for i in range(len(parent_ids))
+        )
+        query = f"""
+        query GetSubfoldersBatch({params}) {{
+          assets {{
+            {aliases}
+          }}
+        }}
+        """
+
+        subfolders: Dict[int, List[Dict]] = {}
+        try:
+            result = self._gql(query, variables, cache=True)
+            assets = (result.get('data') or {}).get('assets') or {}
+
+            for i, parent_id in enumerate(parent_ids):
+                if assets.get(f"f{i}") is not None:
+                    subfolders[parent_id] = assets[f"f{i}"]
+
+        except Exception as e:
+            print(f"  Failed to get subfolders batch: {e}")
+
+        # Parents missing from the batch response are queried one by one
+        for parent_id in parent_ids:
+            if parent_id not in subfolders:
+                subfolders[parent_id] = self._query_subfolders(parent_id)
+
+        return subfolders
+
     def get_all_folders(self) -> List[Dict]:
         """Get all folders recursively and build folder path mapping"""
         all_folders = [{'id': 0, 'name': 'root', 'path': ''}]  # Start with root folder
-        folders_to_check = [0]  # Start with root
+        current_level = [0]  # Start with root
         folder_paths = {0: ''}  # Map folder ID to full path
-        
-        while folders_to_check:
-            parent_id = folders_to_check.pop(0)
-            parent_path = folder_paths.get(parent_id, '')
-            
-            try:
-                query = f"""
-                query GetSubfolders {{
-                  assets {{
-                    folders(parentFolderId: {parent_id}) {{
-                      id
-                      name
-                      slug
-                    }}
-                  }}
-                }}
-                """
-                
-                response = self.session.post(self.graphql_url, json={'query': query})
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    if 'data' in result and 'assets' in result['data'] and 'folders' in result['data']['assets']:
-                        subfolders = result['data']['assets']['folders']
-                        
-                        for folder in subfolders:
-                            folder_id = folder.get('id')
-                            folder_name = folder.get('name', 'Unnamed')
-                            
-                            if folder_id and folder_id not in [f['id'] for f in all_folders]:
-                                # Build full path for this folder
-                                if parent_path:
-                                    full_path = f"{parent_path}/{folder_name}"
-                                else:
-                                    full_path = folder_name
-                                
-                                folder['path'] = full_path
-                                folder_paths[folder_id] = full_path
-                                
-                                all_folders.append(folder)
-                                folders_to_check.append(folder_id)  # Check this folder for subfolders
-                                print(f"  Found folder: {full_path} (ID: {folder_id})")
-                                
-            except Exception as e:
-                print(f"  Failed to get subfolders of {parent_id}: {e}")
-        
+        seen_ids: Set[int] = {0}  # Folder IDs already in all_folders
+
+        # Breadth-first, one tree level at a time: siblings are batched into
+        # aliased queries and the batches run in parallel
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            while current_level:
+                batches = [current_level[i:i + FOLDER_BATCH_SIZE]
+                           for i in range(0, len(current_level), FOLDER_BATCH_SIZE)]
+                results: Dict[int, List[Dict]] = {}
+                for batch_result in executor.map(self._batch_subfolders, batches):
+                    results.update(batch_result)
+                next_level = []
+
+                for parent_id in current_level:
+                    parent_path = folder_paths.get(parent_id, '')
+                    subfolders = results.get(parent_id, [])
+
+                    for folder in subfolders:
+                        folder_id = folder.get('id')
+                        folder_name = folder.get('name', 'Unnamed')
+
+                        if folder_id and folder_id not in seen_ids:
+                            # Build full path for this folder
+                            if parent_path:
+                                full_path = f"{parent_path}/{folder_name}"
+                            else:
+                                full_path = folder_name
+
+                            folder['path'] = full_path
+                            folder_paths[folder_id] = full_path
+
+                            all_folders.append(folder)
+                            seen_ids.add(folder_id)
+                            next_level.append(folder_id)  # Check this folder for subfolders
+                            logger.debug("  Found folder: %s (ID: %s)", full_path, folder_id)
+
+                current_level = next_level
+
         print(f"  Total folders found: {len(all_folders)}")
-        
+
         # Store folder paths for later use
         self.folder_paths = folder_paths
         return all_folders
@@ -563,33 +1037,114 @@ class WikiJSGraphQLExporter:
 
         try:
             # Try to get a sample of assets without kind filter
-            query = f"""
-            query DiscoverAssetTypes {{
-              assets {{
-                list(folderId: {folder_id}) {{
-                  kind
-                  filename
-                  ext
-                  mime
-                }}
-              }}
-            }}
-            """
-
-            response = self.session.post(self.graphql_url, json={'query': query})
+            result = self._gql(DISCOVER_ASSET_TYPES, {'folderId': folder_id}, cache=True)
 
-            if response.status_code == 200:
-                result = response.json()
-
-                if ('data' in result and 'assets' in result['data']
-                    and 'list' in result['data']['assets']):
-                    return result['data']['assets']['list']
+            if (result.get('data') and result['data'].get('assets')
+                and result['data']['assets'].get('list') is not None):
+                self._kindless_supported = True
+                return result['data']['assets']['list']
 
         except Exception as e:
             print(f"    Failed to discover asset types: {e}")
 
         return []
 
+    def _fetch_folder_assets_by_kinds(self, folder_id: int, kinds: List[str]) -> Optional[List[Dict]]:
+        """Get a folder's assets of several kinds with one aliased query; None if it was rejected"""
+        variables: Dict[str, Any] = {'folderId': folder_id}
+        variables.update({f"k{i}": kind for i, kind in enumerate(kinds)})
+        params = ', '.join(['$folderId: Int!'] + [f"$k{i}: AssetKind!" for i in range(len(kinds))])
+        aliases = ''.join(
+            f"\n    k{i}: list(folderId: $folderId, kind: $k{i}) {{{ASSET_FIELDS}    }}" for i in range(len(kinds))
+        )
+        query = f"query GetAssetsFromFolderByKinds({params}) {{\n  assets {{{aliases}\n  }}\n}}"
+
+        result = self._gql(query, variables)
+        assets = (result.get('data') or {}).get('assets')
+        if result.get('errors') or not assets:
+            return None
+
+        kind_assets = []
+        for i, kind in enumerate(kinds):
+            folder_assets = assets.get(f"k{i}") or []
+            if folder_assets:
+                logger.debug("    Found %s %s assets", len(folder_assets), kind)
+                kind_assets.extend(folder_assets)
+        return kind_assets
+
+    def _fetch_folder_assets(self, folder: Dict, discovered_kinds: Set[str]) -> List[Dict]:
+        """Get all assets from a single folder, falling back to per-kind queries"""
+        folder_id = folder.get('id')
+        folder_path = folder.get('path', '')  # Use full folder path
+
+        logger.debug("  Checking folder: %s (ID: %s)", folder_path if folder_path else 'root', folder_id)
+
+        # Try to get all assets without kind filter first, unless the server
+        # already rejected kind-less listing
+        if self._kindless_supported is not False:
+            try:
+                result = self._gql(GET_FOLDER_ASSETS, {'folderId': folder_id})
+                folder_assets = ((result.get('data') or {}).get('assets') or {}).get('list')
+
+                if folder_assets is not None:
+                    self._kindless_supported = True
+
+                    if folder_assets:
+                        logger.debug("    Found %s assets (all types)", len(folder_assets))
+                        # Add full folder path to each asset
+                        for asset in folder_assets:
+                            asset['folder_path'] = folder_path  # Add full path
+                    return folder_assets  # Skip individual kind queries if this worked
+
+                if self._kindless_supported is None:
+                    print("    Kind-less asset listing not supported, querying by kind")
+                    self._kindless_supported = False
+
+            except Exception as e:
+                logger.warning("    Failed to get all assets from folder %s: %s", folder_id, e)
+
+        # Fallback: Get assets of all kinds in one aliased query
+        kinds = sorted(discovered_kinds)
+        if self._kind_batch_supported is not False:
+            try:
+                kind_assets = self._fetch_folder_assets_by_kinds(folder_id, kinds)
+
+                if kind_assets is not None:
+                    self._kind_batch_supported = True
+                    # Add full folder path to each asset
+                    for asset in kind_assets:
+                        asset['folder_path'] = folder_path  # Add full path
+                    return kind_assets
+
+                if self._kind_batch_supported is None:
+                    print("    Aliased per-kind asset query rejected, querying kinds one by one")
+                    self._kind_batch_supported = False
+
+            except Exception as e:
+                logger.warning("    Failed to get assets by kind from folder %s: %s", folder_id, e)
+
+        # Last resort: Get assets by individual kinds
+        kind_assets = []
+        for kind in kinds:
+            try:
+                result = self._gql(GET_FOLDER_ASSETS_BY_KIND, {'folderId': folder_id, 'kind': kind})
+
+                if (result.get('data') and result['data'].get('assets')
+                    and 'list' in result['data']['assets']):
+                    folder_assets = result['data']['assets']['list']
+
+                    if folder_assets:
+                        logger.debug("    Found %s %s assets", len(folder_assets), kind)
+                        # Add full folder path to each asset
+                        for asset in folder_assets:
+                            asset['folder_path'] = folder_path  # Add full path
+                        kind_assets.extend(folder_assets)
+
+            except Exception as e:
+                logger.warning("    Failed to get %s assets from folder %s: %s", kind, folder_id, e)
+
+        return kind_assets
+
     def get_all_assets_from_folders(self, folders: List[Dict]) -> List[Dict]:
         """Get all assets from all folders (all types including XML, documents, etc.)"""
         all_assets = []
@@ -611,91 +1166,10 @@ class WikiJSGraphQLExporter:
 
         print(f"  Asset types to fetch: {sorted(discovered_kinds)}")
 
-        for folder in folders:
-            folder_id = folder.get('id')
-            folder_path = folder.get('path', '')  # Use full folder path
-
-            print(f"  Checking folder: {folder_path if folder_path else 'root'} (ID: {folder_id})")
-
-            # Try to get all assets without kind filter first
-            try:
-                query = f"""
-                query GetAllAssetsFromFolder {{
-                  assets {{
-                    list(folderId: {folder_id}) {{
-                      id
-                      filename
-                      ext
-                      kind
-                      mime
-                      fileSize
-                      folder {{
-                        name
-                      }}
-                    }}
-                  }}
-                }}
-                """
-
-                response = self.session.post(self.graphql_url, json={'query': query})
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    if ('data' in result and 'assets' in result['data']
-                        and 'list' in result['data']['assets']):
-                        folder_assets = result['data']['assets']['list']
-
-                        if folder_assets:
-                            print(f"    Found {len(folder_assets)} assets (all types)")
-                            # Add full folder path to each asset
-                            for asset in folder_assets:
-                                asset['folder_path'] = folder_path  # Add full path
-                            all_assets.extend(folder_assets)
-                            continue  # Skip individual kind queries if this worked
-
-            except Exception as e:
-                print(f"    Failed to get all assets from folder {folder_id}: {e}")
-
-            # Fallback: Get assets by individual kinds
-            for kind in discovered_kinds:
-                try:
-                    query = f"""
-                    query GetAssetsFromFolder {{
-                      assets {{
-                        list(folderId: {folder_id}, kind: {kind}) {{
-                          id
-                          filename
-                          ext
-                          kind
-                          mime
-                          fileSize
-                          folder {{
-                            name
-                          }}
-                        }}
-                      }}
-                    }}
-                    """
-
-                    response = self.session.post(self.graphql_url, json={'query': query})
-
-                    if response.status_code == 200:
-                        result = response.json()
-
-                        if ('data' in result and 'assets' in result['data']
-                            and 'list' in result['data']['assets']):
-                            folder_assets = result['data']['assets']['list']
-
-                            if folder_assets:
-                                print(f"    Found {len(folder_assets)} {kind} assets")
-                                # Add full folder path to each asset
-                                for asset in folder_assets:
-                                    asset['folder_path'] = folder_path  # Add full path
-                                all_assets.extend(folder_assets)
-
-                except Exception as e:
-                    print(f"    Failed to get {kind} assets from folder {folder_id}: {e}")
+        # Folder queries are independent, so overlap their round-trips
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for folder_assets in executor.map(lambda f: self._fetch_folder_assets(f, discovered_kinds), folders):
+                all_assets.extend(folder_assets)
 
         # Remove duplicates based on filename and folder path
         unique_assets = {}
@@ -723,43 +1197,54 @@ class WikiJSGraphQLExporter:
         return final_assets
     
     
+    def _scan_existing_files(self) -> frozenset:
+        """Collect paths (relative to output_dir) of non-empty files left by a previous run"""
+        root_len = len(str(self.output_dir)) + 1
+        found = []
+        stack = [str(self.output_dir)]
+
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        # d_type from the directory listing answers is_dir()/is_file() without
+                        # a syscall; symlinked directories are not followed (no loops)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        # Empty files and .part files are leftovers of interrupted downloads;
+                        # names starting with '_' or '.' are the exporter's own reports and cache
+                        elif (entry.is_file() and entry.name[0] not in '_.'
+                              and not entry.name.endswith(PARTIAL_DOWNLOAD_SUFFIX)
+                              and entry.stat().st_size > 0):
+                            found.append(entry.path[root_len:].replace(os.sep, '/'))
+            except OSError:
+                continue
+
+        return frozenset(found)
+
     def download_asset(self, filename: str, folder: str = "") -> bool:
         """Download an asset file (only from this WikiJS instance)"""
-        # Clean filename - remove size parameters like =500x, =300x200, =40%x, =70%x, etc.
-        import re
-        import urllib.parse
+        # Resumed runs: files already on disk are skipped before any other work
+        raw_key = (f"{folder}/{filename}" if folder else filename).lstrip('/')
+        if raw_key in self._existing_files or raw_key in self.successfully_downloaded:
+            return True
 
         # Security check: Don't download if filename contains suspicious patterns
         if any(pattern in filename.lower() for pattern in ['http://', 'https://', '../', '..']):
-            print(f"  Skipping suspicious filename: {filename}")
+            logger.warning("  Skipping suspicious filename: %s", filename)
 
             # Track as failed download
             asset_key = filename.lstrip('/')
-            if asset_key not in self.failed_downloads:
-                self.failed_downloads[asset_key] = []
-            self.failed_downloads[asset_key].append("Suspicious filename (security)")
+            self.failed_downloads.setdefault(asset_key, []).append("Suspicious filename (security)")
 
             return False
 
-        # First decode URL encoding
-        decoded_filename = urllib.parse.unquote(filename)
-
-        # Remove various size parameter patterns:
-        # =500x300, =500x, =40%x, =70%x, etc.
-        size_patterns = [
-            r'\s*=\d+%?x\d*%?\s*$',  # =40%x, =70%x, =500x300, =500x
-            r'\s*=\d+%?\s*$',        # =40%, =500
-            r'\s*=\d+x\d+\s*$',      # =500x300
-            r'\s*=\d+x\s*$',         # =500x
-        ]
+        # Clean filename - decode and remove size parameters like =500x, =300x200, =40%x, =70%x, etc.
+        clean_filename = self.clean_asset_url(filename)
 
-        clean_filename = decoded_filename
-        for pattern in size_patterns:
-            clean_filename = re.sub(pattern, '', clean_filename)
-
-        print(f"  Original: {filename}")
-        if clean_filename != decoded_filename:
-            print(f"  Cleaned:  {clean_filename}")
+        logger.debug("  Original: %s", filename)
+        if clean_filename != filename:
+            logger.debug("  Cleaned:  %s", clean_filename)
         
         # Construct asset URL
         if folder:
@@ -770,30 +1255,27 @@ class WikiJSGraphQLExporter:
         # Check if already downloaded
         asset_key = asset_path.lstrip('/')
         if asset_key in self.successfully_downloaded:
-            print(f"  Skipping {asset_path} (already downloaded)")
+            logger.debug("  Skipping %s (already downloaded)", asset_path)
+            return True
+        if asset_key in self._existing_files:
+            logger.debug("  Skipping %s (already exists)", asset_path)
+            self.successfully_downloaded.add(asset_key)
             return True
-        
-        asset_url = f"{self.wiki_url}{asset_path}"
         
         try:
-            print(f"  Downloading: {asset_path}")
+            logger.debug("  Downloading: %s", asset_path)
 
             # Try different asset URL patterns (all relative to this wiki instance)
-            # This ensures we only download files hosted on this WikiJS instance
-            asset_urls_to_try = [
-                asset_url,  # Direct path - works!
-                f"{self.wiki_url}/a{asset_path}",  # WikiJS asset page (returns HTML)
-                f"{self.wiki_url}/assets{asset_path}",
-                f"{self.wiki_url}/uploads{asset_path}",
-                f"{self.wiki_url}/files{asset_path}",
-                f"{self.wiki_url}/content{asset_path}",
-                f"{self.wiki_url}/media{asset_path}",
-                f"{self.wiki_url}/static{asset_path}"
-            ]
+            # This ensures we only download files hosted on this WikiJS instance.
+            # The prefix that worked last time goes first, so usually one request suffices.
+            prefixes = ASSET_URL_PREFIXES
+            if self._asset_prefix is not None:
+                prefixes = [self._asset_prefix] + [p for p in ASSET_URL_PREFIXES if p != self._asset_prefix]
             
-            for i, url in enumerate(asset_urls_to_try, 1):
+            for i, prefix in enumerate(prefixes, 1):
+                url = f"{self.wiki_url}{prefix}{asset_path}"
                 try:
-                    print(f"    Trying {i}: {url}")
+                    logger.debug("    Trying %s: %s", i, url)
                     
                     # Include authentication headers for asset download
                     headers = {
@@ -801,48 +1283,74 @@ class WikiJSGraphQLExporter:
                         'User-Agent': 'WikiJS-Exporter/1.0'
                     }
                     
-                    response = requests.get(url, headers=headers, stream=True, timeout=10)
-                    print(f"      Status: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        # Verify it's not an HTML error page
-                        content_type = response.headers.get('content-type', '')
-                        if 'text/html' in content_type.lower():
-                            print(f"      Skipping HTML response")
+                    # While the serving prefix is unknown, a HEAD request rules out
+                    # HTML pages and errors without transferring a body
+                    # (servers that don't support HEAD fall through to the GET)
+                    if self._asset_prefix is None:
+                        head = self.session.head(url, headers=headers, allow_redirects=True, timeout=10)
+                        head_type = head.headers.get('content-type', '').lower()
+                        if head.status_code == 200 and 'text/html' in head_type:
+                            logger.debug("      Skipping HTML response (HEAD)")
                             continue
-                            
-                        # Create local path
-                        local_path = self.output_dir / asset_path.lstrip('/')
-                        local_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        # Write file
-                        with open(local_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        file_size = local_path.stat().st_size
-                        print(f"    ✓ Downloaded: {local_path} ({file_size:,} bytes) - skipping remaining URLs")
+                        if head.status_code not in (200, 405, 501):
+                            logger.debug("      Status: %s (HEAD)", head.status_code)
+                            continue
+                    
+                    # Streamed responses hold their connection until closed; the
+                    # context manager returns it to the pool on every path
+                    with self.session.get(url, headers=headers, stream=True, timeout=10) as response:
+                        logger.debug("      Status: %s", response.status_code)
                         
-                        # Mark as successfully downloaded
-                        self.successfully_downloaded.add(asset_key)
-                        return True
+                        if response.status_code == 200:
+                            # Verify it's not an HTML error page
+                            content_type = response.headers.get('content-type', '')
+                            if 'text/html' in content_type.lower():
+                                logger.debug("      Skipping HTML response")
+                                continue
+                                
+                            # Create local path
+                            local_path = self.output_dir / asset_path.lstrip('/')
+                            local_path.parent.mkdir(parents=True, exist_ok=True)
+                            
+                            # Write file straight from the raw stream in large chunks; memory use
+                            # stays at one chunk regardless of asset size. (urllib3's readinto()
+                            # reads into a temporary bytes object itself, so a reused buffer
+                            # would not save the per-chunk allocation.)
+                            # The download goes to a .part file that only replaces the final
+                            # path once complete, so an interrupted transfer never leaves a
+                            # truncated file that a resumed export would take as downloaded
+                            response.raw.decode_content = True
+                            part_path = local_path.with_name(local_path.name + PARTIAL_DOWNLOAD_SUFFIX)
+                            try:
+                                with open(part_path, 'wb') as f:
+                                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                                os.replace(part_path, local_path)
+                            except BaseException:
+                                part_path.unlink(missing_ok=True)
+                                raise
+                            
+                            file_size = local_path.stat().st_size
+                            logger.debug("    ✓ Downloaded: %s (%d bytes) - skipping remaining URLs", local_path, file_size)
+                            
+                            # Mark as successfully downloaded
+                            self.successfully_downloaded.add(asset_key)
+                            self._asset_prefix = prefix
+                            return True
                         
                 except Exception as e:
-                    print(f"      Error: {e}")
+                    logger.debug("      Error: %s", e)
                     continue
             
-            print(f"    ✗ Failed to download {filename}")
+            logger.warning("    ✗ Failed to download %s", filename)
 
             # Track failed download
             asset_key = asset_path.lstrip('/')
-            if asset_key not in self.failed_downloads:
-                self.failed_downloads[asset_key] = []
-            self.failed_downloads[asset_key].append("All download URLs failed")
+            self.failed_downloads.setdefault(asset_key, []).append("All download URLs failed")
 
             return False
             
         except Exception as e:
-            print(f"    ✗ Error downloading {filename}: {e}")
+            logger.warning("    ✗ Error downloading %s: %s", filename, e)
             return False
     
     def save_page_as_markdown(self, page: Dict) -> Path:
@@ -865,31 +1373,25 @@ class WikiJSGraphQLExporter:
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Build frontmatter (same format as WikiJS git export)
-        frontmatter = {
-            'title': title,
-            'description': page.get('description', ''),
-            'published': page.get('isPublished', True),
-            'date': page.get('updatedAt', ''),
-            'tags': [tag.get('tag', '') for tag in page.get('tags', []) if tag.get('tag')],
-            'editor': page.get('editor', 'markdown'),
-            'dateCreated': page.get('createdAt', '')
-        }
-        
-        # Clean empty values
-        frontmatter = {k: v for k, v in frontmatter.items() if v or k == 'published'}
+        description = page.get('description', '')
+        date = page.get('updatedAt', '')
+        tags = [tag.get('tag', '') for tag in page.get('tags', []) if tag.get('tag')]
+        editor = page.get('editor', 'markdown')
+        created = page.get('createdAt', '')
+        frontmatter = _FRONTMATTER_TEMPLATE.format(
+            title=f'title: {title}\n' if title else '',
+            description=f'description: {description}\n' if description else '',
+            published=page.get('isPublished', True),
+            date=f'date: {date}\n' if date else '',
+            tags=f'tags: {_json_dumps(tags).decode()}\n' if tags else '',
+            editor=f'editor: {editor}\n' if editor else '',
+            created=f'dateCreated: {created}\n' if created else ''
+        )
         
-        # Write markdown file with YAML frontmatter
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('---\n')
-            for key, value in frontmatter.items():
-                if isinstance(value, list) and value:
-                    f.write(f'{key}: {json.dumps(value)}\n')
-                elif not isinstance(value, list):
-                    f.write(f'{key}: {value}\n')
-            f.write('---\n\n')
-            f.write(content)
+        # Write markdown file with YAML frontmatter in a single call
+        file_path.write_text(frontmatter + content, encoding='utf-8')
         
-        print(f"  ✓ Saved: {file_path}")
+        logger.debug("  ✓ Saved: %s", file_path)
         
         # Extract and queue assets for download
         self.extract_and_queue_assets(content, file_path)
@@ -899,98 +1401,52 @@ class WikiJSGraphQLExporter:
     def extract_and_queue_assets(self, content: str, page_path: Path):
         """Extract asset references from content and queue them for download"""
 
-        # Enhanced patterns to capture more file types and formats
-        asset_patterns = [
-            r'!\[([^\]]*)\]\(([^)]+)\)',  # Markdown images
-            r'<img[^>]+src=["\']([^"\']+)["\']',  # HTML img tags
-            # Enhanced markdown link patterns for files
-            r'\[([^\]]*)\]\((/[^)]+\.(?:xml|txt|csv|json|pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|yaml|yml|drawio)(?:\s*=[^)]*)?)\)',
-            r'\[([^\]]*)\]\(([^)]+\.(?:xml|txt|csv|json|pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|yaml|yml|drawio)(?:\s*=[^)]*)?)\)',  # Any file with these extensions
-            # HTML links to files
-            r'<a[^>]+href=["\']([^"\']+\.(?:xml|txt|csv|json|pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|yaml|yml|drawio)(?:\s*=[^"\']*)?)["\']',
-            # Additional patterns for common file extensions in various contexts
-            r'src=["\']([^"\']*\.(?:jpg|jpeg|png|gif|svg|webp|pdf|doc|docx|xls|xlsx|ppt|pptx|xml|txt|zip|rar|7z|yaml|yml)(?:\s*=[^"\']*)?)["\']',
-            r'href=["\']([^"\']*\.(?:pdf|doc|docx|xls|xlsx|ppt|pptx|xml|txt|zip|rar|7z|csv|json|yaml|yml|drawio)(?:\s*=[^"\']*)?)["\']',
-        ]
-
-        print(f"    Extracting file references from {page_path.name}")
+        logger.debug("    Extracting file references from %s", page_path.name)
         
-        for pattern in asset_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    asset_url = match[-1]  # Get the URL part
-                else:
-                    asset_url = match
-
-                if asset_url and self.is_wiki_hosted_asset(asset_url):
-                    # Clean the asset URL
-                    cleaned_url = self.clean_asset_url(asset_url)
-                    if cleaned_url:
-                        asset_key = cleaned_url.lstrip('/')
-                        self.downloaded_assets.add(asset_key)
-                        print(f"      Found file reference: {asset_key}")
-
-                        # Track which page references this asset
-                        page_name = page_path.name
-                        if asset_key not in self.asset_to_pages:
-                            self.asset_to_pages[asset_key] = []
-                        if page_name not in self.asset_to_pages[asset_key]:
-                            self.asset_to_pages[asset_key].append(page_name)
+        # Each distinct URL on the page is checked and cleaned once
+        asset_urls = {asset_url for pattern in _ASSET_RES for asset_url in pattern.findall(content)}
+        asset_keys = {
+            self.clean_asset_url(asset_url).lstrip('/')
+            for asset_url in asset_urls
+            if asset_url and self.is_wiki_hosted_asset(asset_url)
+        }
+        asset_keys.discard('')
+
+        # Queue the assets and track which page references them
+        page_name = page_path.name
+        for asset_key in asset_keys:
+            logger.debug("      Found file reference: %s", asset_key)
+            self.asset_to_pages[asset_key].add(page_name)
 
     def clean_asset_url(self, asset_url: str) -> str:
         """Clean asset URL by removing size parameters and decoding"""
-        import urllib.parse
-        import re
-
-        # First decode URL encoding
-        decoded_url = urllib.parse.unquote(asset_url)
-
-        # Remove various size parameter patterns from the URL
-        size_patterns = [
-            r'\s*=\d+%?x\d*%?\s*$',  # =40%x, =70%x, =500x300, =500x
-            r'\s*=\d+%?\s*$',        # =40%, =500
-            r'\s*=\d+x\d+\s*$',      # =500x300
-            r'\s*=\d+x\s*$',         # =500x
-        ]
-
-        clean_url = decoded_url
-        for pattern in size_patterns:
-            clean_url = re.sub(pattern, '', clean_url)
-
-        return clean_url
+        # Decode URL encoding, then strip size parameters like =500x, =300x200, =40%x, =70%
+        return _clean_asset_url(asset_url)
 
     def is_wiki_hosted_asset(self, asset_url: str) -> bool:
         """Check if the asset URL is hosted on this WikiJS instance"""
-        import urllib.parse
-
         # If it's a relative URL (no protocol), it's likely hosted on the wiki
         if not asset_url.startswith(('http://', 'https://', '//')):
             return True
 
         # If it's an absolute URL, check if it's from the same domain
         try:
-            parsed_asset = urllib.parse.urlparse(asset_url)
-            parsed_wiki = urllib.parse.urlparse(self.wiki_url)
+            asset_domain = _url_host(asset_url)
 
             # Same domain/host means it's hosted on this wiki
-            if parsed_asset.netloc.lower() == parsed_wiki.netloc.lower():
+            if asset_domain == self._wiki_netloc:
                 return True
 
-            # Also check if it's a subdomain of the wiki domain
-            wiki_domain = parsed_wiki.netloc.lower()
-            asset_domain = parsed_asset.netloc.lower()
-
             # Allow subdomains (e.g., cdn.wiki.example.com for wiki.example.com)
-            if asset_domain.endswith('.' + wiki_domain):
+            if asset_domain.endswith(self._wiki_netloc_dot):
                 return True
 
         except Exception as e:
-            print(f"    Warning: Could not parse URL {asset_url}: {e}")
+            logger.warning("    Could not parse URL %s: %s", asset_url, e)
             return False
 
         # External URL - don't download
-        print(f"    Skipping external asset: {asset_url}")
+        logger.debug("    Skipping external asset: %s", asset_url)
         return False
 
     def generate_failed_assets_log(self):
@@ -1001,85 +1457,91 @@ class WikiJSGraphQLExporter:
 
         log_file = self.output_dir / '_failed_assets_log.md'
 
-        with open(log_file, 'w', encoding='utf-8') as f:
-            f.write("# Failed Asset Downloads Report\n\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write(f"Wiki URL: {self.wiki_url}\n\n")
+        # The report is assembled in memory and written with a single call
+        lines: List[str] = []
+        lines.append("# Failed Asset Downloads Report\n\n")
+        lines.append(f"Generated: {datetime.now().isoformat()}\n")
+        lines.append(f"Wiki URL: {self.wiki_url}\n\n")
 
-            f.write(f"## Summary\n\n")
-            f.write(f"- **Total failed assets**: {len(self.failed_downloads)}\n")
-            f.write(f"- **Total exported pages**: {len(self.exported_pages)}\n")
-            f.write(f"- **Successfully downloaded assets**: {len(self.successfully_downloaded)}\n\n")
+        lines.append(f"## Summary\n\n")
+        lines.append(f"- **Total failed assets**: {len(self.failed_downloads)}\n")
+        lines.append(f"- **Total exported pages**: {len(self.exported_pages)}\n")
+        lines.append(f"- **Successfully downloaded assets**: {len(self.successfully_downloaded)}\n\n")
 
-            f.write("## Failed Assets by Page\n\n")
+        lines.append("## Failed Assets by Page\n\n")
 
-            # Group failed assets by the pages that reference them
-            page_to_failed_assets = {}
-            orphaned_assets = []
+        # Group failed assets by the pages that reference them
+        page_to_failed_assets = {}
+        orphaned_assets = []
 
-            for asset_path, reasons in self.failed_downloads.items():
-                referencing_pages = self.asset_to_pages.get(asset_path, [])
+        for asset_path, reasons in self.failed_downloads.items():
+            referencing_pages = self.asset_to_pages.get(asset_path)
 
-                if referencing_pages:
-                    for page in referencing_pages:
-                        if page not in page_to_failed_assets:
-                            page_to_failed_assets[page] = []
-                        page_to_failed_assets[page].append((asset_path, reasons))
-                else:
-                    orphaned_assets.append((asset_path, reasons))
-
-            # Write failed assets grouped by page
-            for page_name in sorted(page_to_failed_assets.keys()):
-                f.write(f"### 📄 {page_name}\n\n")
-
-                failed_assets = page_to_failed_assets[page_name]
-                for asset_path, reasons in failed_assets:
-                    f.write(f"- **{asset_path}**\n")
-                    for reason in reasons:
-                        f.write(f"  - ❌ {reason}\n")
-                f.write("\n")
-
-            # Write orphaned failed assets (not referenced by any exported page)
-            if orphaned_assets:
-                f.write("### 🔍 Assets Not Referenced by Exported Pages\n\n")
-                f.write("These assets failed to download but were not found in any exported page content:\n\n")
-
-                for asset_path, reasons in orphaned_assets:
-                    f.write(f"- **{asset_path}**\n")
-                    for reason in reasons:
-                        f.write(f"  - ❌ {reason}\n")
-                f.write("\n")
-
-            f.write("## All Failed Assets (Alphabetical)\n\n")
-            for asset_path in sorted(self.failed_downloads.keys()):
-                reasons = self.failed_downloads[asset_path]
-                referencing_pages = self.asset_to_pages.get(asset_path, [])
-
-                f.write(f"### {asset_path}\n\n")
-                f.write("**Failure reasons:**\n")
+            if referencing_pages:
+                for page in referencing_pages:
+                    if page not in page_to_failed_assets:
+                        page_to_failed_assets[page] = []
+                    page_to_failed_assets[page].append((asset_path, reasons))
+            else:
+                orphaned_assets.append((asset_path, reasons))
+
+        # Write failed assets grouped by page
+        for page_name in sorted(page_to_failed_assets.keys()):
+            lines.append(f"### 📄 {page_name}\n\n")
+
+            failed_assets = page_to_failed_assets[page_name]
+            for asset_path, reasons in failed_assets:
+                lines.append(f"- **{asset_path}**\n")
                 for reason in reasons:
-                    f.write(f"- ❌ {reason}\n")
+                    lines.append(f"  - ❌ {reason}\n")
+            lines.append("\n")
 
-                if referencing_pages:
-                    f.write("\n**Referenced by pages:**\n")
-                    for page in referencing_pages:
-                        f.write(f"- 📄 {page}\n")
-                else:
-                    f.write("\n**Referenced by:** *(No exported pages)*\n")
-                f.write("\n")
+        # Write orphaned failed assets (not referenced by any exported page)
+        if orphaned_assets:
+            lines.append("### 🔍 Assets Not Referenced by Exported Pages\n\n")
+            lines.append("These assets failed to download but were not found in any exported page content:\n\n")
+
+            for asset_path, reasons in orphaned_assets:
+                lines.append(f"- **{asset_path}**\n")
+                for reason in reasons:
+                    lines.append(f"  - ❌ {reason}\n")
+            lines.append("\n")
+
+        lines.append("## All Failed Assets (Alphabetical)\n\n")
+        for asset_path in sorted(self.failed_downloads.keys()):
+            reasons = self.failed_downloads[asset_path]
+            referencing_pages = sorted(self.asset_to_pages.get(asset_path, ()))
+
+            lines.append(f"### {asset_path}\n\n")
+            lines.append("**Failure reasons:**\n")
+            for reason in reasons:
+                lines.append(f"- ❌ {reason}\n")
+
+            if referencing_pages:
+                lines.append("\n**Referenced by pages:**\n")
+                for page in referencing_pages:
+                    lines.append(f"- 📄 {page}\n")
+            else:
+                lines.append("\n**Referenced by:** *(No exported pages)*\n")
+            lines.append("\n")
+
+        with open(log_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
 
         print(f"✓ Failed assets log saved: {log_file}")
         print(f"  - {len(self.failed_downloads)} failed assets logged")
 
         # Also create a simple CSV for easy processing
         csv_file = self.output_dir / '_failed_assets.csv'
-        with open(csv_file, 'w', encoding='utf-8') as f:
+        with open(csv_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            # Same layout as before: a plain header, then every field quoted, with
+            # quotes inside fields escaped by csv.writer
             f.write("Asset Path,Failure Reason,Referencing Pages\n")
-            for asset_path, reasons in self.failed_downloads.items():
-                referencing_pages = self.asset_to_pages.get(asset_path, [])
-                reason_str = "; ".join(reasons)
-                pages_str = "; ".join(referencing_pages) if referencing_pages else "None"
-                f.write(f'"{asset_path}","{reason_str}","{pages_str}"\n')
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')
+            writer.writerows(
+                (asset_path, "; ".join(reasons), "; ".join(sorted(self.asset_to_pages.get(asset_path, ()))) or "None")
+                for asset_path, reasons in self.failed_downloads.items()
+            )
 
         print(f"✓ Failed assets CSV saved: {csv_file}")
 
@@ -1089,8 +1551,8 @@ class WikiJSGraphQLExporter:
         print("WikiJS Complete GraphQL Export")
         print("=" * 60)
         
-        # Step 1: Test connection
-        if not self.test_graphql_connection():
+        # Step 1: Test connection (a setup cached by a previous run is checked with one query)
+        if not (self._use_cached_connection() or self.test_graphql_connection()):
             print("\n✗ Cannot establish GraphQL connection")
             print("\nTroubleshooting:")
             print("1. Check if GraphQL API is enabled in WikiJS admin panel")
@@ -1098,6 +1560,17 @@ class WikiJSGraphQLExporter:
             print("3. Check if WikiJS has API rate limiting enabled")
             print("4. Try using admin account token")
             return
+
+        # Files from a previous run into the same directory are not downloaded again
+        self._existing_files = self._scan_existing_files()
+        if self._existing_files:
+            print(f"\nFound {len(self._existing_files)} existing files in {self.output_dir}")
+
+        # Asset discovery does not depend on the exported pages, so the folder
+        # and asset listing runs in the background while pages are exported
+        background = ThreadPoolExecutor(max_workers=1)
+        assets_future = background.submit(self.fetch_assets_list)
+        background.shutdown(wait=False)
         
         if not self.assets_only:
             # Step 2: Fetch all pages
@@ -1113,29 +1586,37 @@ class WikiJSGraphQLExporter:
             print("EXPORTING PAGES")
             print("="*40)
             
-            for i, page in enumerate(pages, 1):
-                page_id = page.get('id')
-                page_path = page.get('path', f'page_{page_id}')
-                page_title = page.get('title', 'Untitled')
-                
-                print(f"[{i:3d}/{len(pages)}] {page_title} ({page_path})")
-                
-                try:
-                    # Get full content if not already included
-                    if not page.get('content') and page_id:
-                        full_page = self.fetch_page_content(page_id, page_path)
-                        if full_page:
-                            page.update(full_page)
-                    
-                    # Save page
-                    self.save_page_as_markdown(page)
-                    self.exported_pages.append(page)
-                    
-                    # Rate limiting
-                    time.sleep(0.2)
-                    
-                except Exception as e:
-                    print(f"  ✗ Failed: {e}")
+            # Fetch page contents in concurrent batches, save them in the original order.
+            # Saving happens on this thread while the pool keeps fetching the next
+            # batches, so disk writes already overlap with the network requests.
+            batches = [pages[i:i + PAGE_BATCH_SIZE] for i in range(0, len(pages), PAGE_BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                fetched = (page for batch in executor.map(self._fetch_page_batch, batches) for page in batch)
+                for i, page in enumerate(fetched, 1):
+                    page_id = page.get('id')
+                    page_path = page.get('path', f'page_{page_id}')
+                    page_title = page.get('title', 'Untitled')
+
+                    print(f"[{i:3d}/{len(pages)}] {page_title} ({page_path})")
+
+                    try:
+                        # Save page
+                        self.save_page_as_markdown(page)
+                        self.exported_pages.append({
+                            'title': page.get('title'),
+                            'path': page.get('path'),
+                            'id': page.get('id')
+                        })
+
+                    except Exception as e:
+                        print(f"  ✗ Failed: {e}")
+
+                    # The content is on disk now; don't keep it alive in the pages list
+                    page.pop('content', None)
+
+            # Remember the page content query shape for the next run
+            if self._content_query_idx is not None and self._content_query_idx != self._cache.get('content_query_idx'):
+                self._save_cache()
         else:
             print("\n🎯 Assets-only mode: Skipping page export")
         
@@ -1144,10 +1625,14 @@ class WikiJSGraphQLExporter:
         print("EXPORTING ASSETS")
         print("="*40)
         
-        # Try to get assets via GraphQL
-        assets = self.fetch_assets_list()
+        # Assets listed via GraphQL (started before the page export)
+        assets = assets_future.result()
         
-        # Download assets found via GraphQL
+        # The same file can be both listed via GraphQL and referenced in content,
+        # so the download queue is keyed by its cleaned local path
+        to_download: Dict[str, Tuple[str, str]] = {}
+
+        # Assets found via GraphQL
         for asset in assets:
             filename = asset.get('filename', '')
             
@@ -1155,17 +1640,27 @@ class WikiJSGraphQLExporter:
             folder_path = asset.get('folder_path', '')
             
             if filename:
-                self.download_asset(filename, folder_path)
+                asset_key = self.clean_asset_url(f"{folder_path}/{filename}" if folder_path else filename).lstrip('/')
+                to_download.setdefault(asset_key, (filename, folder_path))
         
-        # Download assets referenced in content
-        print(f"\nDownloading {len(self.downloaded_assets)} assets referenced in content...")
-        for asset_path in self.downloaded_assets:
+        # Assets referenced in content
+        print(f"\nDownloading {len(self.asset_to_pages)} assets referenced in content...")
+        for asset_path in self.asset_to_pages:
             if '/' in asset_path:
                 folder, filename = asset_path.rsplit('/', 1)
             else:
                 folder, filename = '', asset_path
             
-            self.download_asset(filename, folder)
+            to_download.setdefault(asset_path, (filename, folder))
+
+        pending = [args for key, args in to_download.items() if key not in self.successfully_downloaded]
+        print(f"Downloading {len(pending)} unique assets...")
+
+        # Downloads are independent and I/O-bound, so they run concurrently over the pooled session.
+        # At most MAX_WORKERS are in flight, each holding a single DOWNLOAD_CHUNK_SIZE chunk,
+        # so peak download memory is bounded regardless of the number or size of assets.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(lambda args: self.download_asset(*args), pending))
 
         # Step 5: Export summary
         print("\n" + "="*60)
@@ -1181,18 +1676,10 @@ class WikiJSGraphQLExporter:
             'wiki_url': self.wiki_url,
             'pages_count': len(self.exported_pages),
             'assets_count': len(self.successfully_downloaded),
-            'pages': [
-                {
-                    'title': page.get('title'),
-                    'path': page.get('path'),
-                    'id': page.get('id')
-                }
-                for page in self.exported_pages
-            ]
+            'pages': self.exported_pages
         }
         
-        with open(self.output_dir / '_export_manifest.json', 'w') as f:
-            json.dump(manifest, f, indent=2)
+        (self.output_dir / '_export_manifest.json').write_bytes(_json_dumps(manifest, indent=True))
 
         print(f"✓ Export manifest saved: {self.output_dir / '_export_manifest.json'}")
 
@@ -1205,11 +1692,19 @@ def main():
     parser.add_argument('--token', required=True, help='WikiJS API token (generate in admin panel)')
     parser.add_argument('--output-dir', default='./wikijs-complete-export', help='Output directory for export')
     parser.add_argument('--assets-only', action='store_true', help='Download only assets (skip pages)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every page, folder and asset download attempt')
     
     args = parser.parse_args()
+
+    # Per-item progress is logged at DEBUG level and only shown with --verbose
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
     
     exporter = WikiJSGraphQLExporter(args.wiki_url, args.token, args.output_dir, args.assets_only)
-    exporter.export_complete_wiki()
+    try:
+        exporter.export_complete_wiki()
+    finally:
+        exporter.session.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -10,23 +10,302 @@ Usage:
 """
 
 import re
+import io
+import csv
+import json
+import binascii
+import hashlib
+import logging
+import math
+import mmap
 import argparse
 import requests
+import yaml
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.fields import RequestField
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 import time
 import mimetypes
 import os
+import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import cached_property
 from datetime import datetime
 
+logger = logging.getLogger("wikijs_to_outline")
+
+# libyaml's C loader when PyYAML was built with it. The base loader keeps every
+# scalar a string, like the line parser does
+try:
+    from yaml import CBaseLoader as YamlLoader
+except ImportError:
+    from yaml import BaseLoader as YamlLoader
+
+
+def _env_number(name: str, default, cast):
+    """Numeric environment variable, or the default if it is unset or not a number"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning("Ignoring %s=%r: not a number", name, value)
+        return default
+
+
+# Write calls (documents.create/move/update, attachments.create) per second
+# across all workers; the WIKIJS_RPS environment variable adjusts it, 0 turns
+# the limit off. A 429 response is retried after its Retry-After delay (see
+# HTTP_RETRY_STATUSES)
+WRITE_REQUESTS_PER_SECOND = _env_number('WIKIJS_RPS', 10.0, float)
+
+# JPEG qualities tried when compressing an oversized image (highest that fits wins)
+JPEG_QUALITY_MIN = 25
+JPEG_QUALITY_MAX = 85
+JPEG_QUALITY_STEP = 5
+
+# WebP quality and effort for lossless sources (PNG, transparency, palettes)
+WEBP_QUALITY = 80
+WEBP_METHOD = 6
+
+# Compressed WebP attachments need a MIME type on Pythons whose table lacks it
+mimetypes.add_type('image/webp', '.webp')
+
+# Concurrent attachment uploads per document
+UPLOAD_WORKERS = 8
+
+# Concurrent documents.create calls (documents of the same depth) and
+# documents.info/documents.update calls in the crosslink pass; the
+# WIKIJS_CONCURRENCY environment variable adjusts it to what the server tolerates
+MIGRATION_WORKERS = max(1, _env_number('WIKIJS_CONCURRENCY', 8, int))
+
+# Write calls allowed back to back before WRITE_REQUESTS_PER_SECOND applies
+WRITE_REQUESTS_BURST = MIGRATION_WORKERS
+
+# HTTP connection pool. Threads beyond the pool size wait for a free keep-alive
+# connection instead of opening one that is thrown away after the request
+# (creation workers each run their own upload pool, so more threads than
+# connections are in flight)
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_SIZE = 32
+HTTP_POOL_BLOCK = True
+
+# HTTP retries. All Outline API calls are POSTs and most of them write, so a
+# request is only resent when the server cannot have processed it: the
+# connection could not be opened, or the server refused the request with one
+# of HTTP_RETRY_STATUSES and a Retry-After header. Read timeouts, dropped
+# connections and gateway errors are not retried, as the document or
+# attachment may already have been created
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = [429, 503]
+
+# Bytes read from an attachment per socket send while streaming an upload
+# (urllib3 1.x always sends 8 KiB blocks)
+HTTP_UPLOAD_BLOCK_SIZE = 256 * 1024
+
+# (connect, read) timeout for Outline API calls so a hung socket can't stall a worker
+HTTP_TIMEOUT = (5, 60)
+
+# Per-Outline record of the token that passed the document creation check
+# (as a fingerprint, never the token), so repeated runs skip the test document
+CACHE_FILENAME = '.wikijs2outline_cache.json'
+
+# Directory (in the wiki directory) of converted page text from earlier runs,
+# one file per blake2b digest of the source text; bump the version whenever
+# convert_wikijs_blocks changes its output. The files have no .md suffix so the
+# page walk never picks them up
+BLOCK_CACHE_DIRNAME = '.wikijs2outline_blocks'
+BLOCK_CONVERTER_VERSION = b'1'
+
+# Markdown image (with optional WikiJS " =WxH" sizing), HTML img tag, or markdown
+# link (a file link if _is_file_link accepts its target)
+_ATTACHMENT_LINK_RE = re.compile(
+    r'(?P<md>!\[(?P<md_alt>[^]]*)\]\((?P<md_target>[^)]+(?:\s*=\w*)?)\))'
+    r'|(?P<html><img[^>]+>)'
+    r'|(?P<file>\[(?P<file_text>[^\]]*)\]\((?P<file_target>[^)]*)\))'
+)
+
+# Extensions of non-image files whose links are uploaded as attachments
+_FILE_EXTS = frozenset({
+    '.xml', '.txt', '.csv', '.json', '.pdf', '.doc', '.docx', '.xls', '.xlsx',
+    '.ppt', '.pptx', '.zip', '.rar', '.7z', '.yaml', '.yml', '.drawio'
+})
+
+
+def _is_file_link(target: str) -> bool:
+    """Whether a link target is a file path, optionally followed by a WikiJS " =size" suffix"""
+    heads = [target] + [target[:i].rstrip() for i, char in enumerate(target) if char == '=']
+    return any(head[head.rfind('.'):].lower() in _FILE_EXTS for head in heads if '.' in head)
+
+
+# HTML img tag on its own, e.g. inside the text of a file link
+_IMG_TAG_RE = re.compile(r'<img[^>]+>')
+
+# name="value" / name='value' attribute of an HTML tag
+_ATTR_RE = re.compile(r'(\w+)=["\']([^"\']*)["\']')
+
+
+def _tag_attrs(tag: str) -> Dict[str, str]:
+    """Attributes of an HTML tag (the first occurrence of a name wins)"""
+    attrs = {}
+    for name, value in _ATTR_RE.findall(tag):
+        attrs.setdefault(name, value)
+    return attrs
+
+# Markdown link [text](url)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# WikiJS block classes and the Outline callout types they become
+_BLOCK_MAPPING = {
+    'is-warning': 'warning',
+    'is-danger': 'warning',
+    'is-info': 'info',
+    'is-success': 'tip',
+    'is-primary': 'info',
+    'is-secondary': 'info'
+}
+
+# Longest block class name, bounds the search for a class's closing brace
+_BLOCK_CLASS_MAX_LEN = max(map(len, _BLOCK_MAPPING))
+
+
+def _block_class_at(content: str, pos: int) -> Optional[Tuple[str, int]]:
+    """WikiJS block class "{.is-...}" starting at pos: (class, end position) or None"""
+    if not content.startswith('{.', pos):
+        return None
+    close = content.find('}', pos + 2, pos + 3 + _BLOCK_CLASS_MAX_LEN)
+    if close == -1 or content[pos + 2:close] not in _BLOCK_MAPPING:
+        return None
+    return content[pos + 2:close], close + 1
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file data with universal newlines, as reading in text mode would"""
+    text = str(data, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class MultipartFileStream:
+    """multipart/form-data body that reads the file part from disk as it is sent"""
+
+    def __init__(self, fields: Dict, name: str, file_obj, filename: str, content_type: str):
+        boundary = binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+
+        preamble = bytearray()
+        for field_name, value in fields.items():
+            field = RequestField(field_name, str(value))
+            field.make_multipart()
+            preamble += f'--{boundary}\r\n{field.render_headers()}'.encode('utf-8')
+            preamble += str(value).encode('utf-8') + b'\r\n'
+        file_field = RequestField(name, b'', filename=filename)
+        file_field.make_multipart(content_type=content_type)
+        preamble += f'--{boundary}\r\n{file_field.render_headers()}'.encode('utf-8')
+
+        file_size = os.fstat(file_obj.fileno()).st_size
+        self._parts = [(bytes(preamble), len(preamble)), (file_obj, file_size),
+                       (f'\r\n--{boundary}--\r\n'.encode('ascii'), len(boundary) + 8)]
+        self._len = sum(size for _, size in self._parts)
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        # Lets urllib3 rewind the body when it retries the request
+        self._pos = {0: 0, 1: self._pos, 2: self._len}[whence] + offset
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._len - self._pos
+        chunks = []
+        start = 0
+        for part, part_size in self._parts:
+            end = start + part_size
+            if size > 0 and start <= self._pos < end:
+                n = min(size, end - self._pos)
+                if isinstance(part, bytes):
+                    chunk = part[self._pos - start:self._pos - start + n]
+                else:
+                    part.seek(self._pos - start)
+                    chunk = part.read(n)
+                chunks.append(chunk)
+                self._pos += len(chunk)
+                size -= len(chunk)
+            start = end
+        return b''.join(chunks)
+
+
+class _RateLimiter:
+    """Token bucket shared between worker threads; a rate of 0 or less means no limit"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class _RefusedRequestRetry(Retry):
+    """Retry that resends a request only if the server refused it with a Retry-After"""
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        return has_retry_after and super().is_retry(method, status_code, has_retry_after)
+
+
+class _StreamingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send streamed bodies in HTTP_UPLOAD_BLOCK_SIZE blocks"""
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if int(urllib3.__version__.split('.')[0]) >= 2:
+            pool_kwargs.setdefault('blocksize', HTTP_UPLOAD_BLOCK_SIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
+class MarkdownFile(NamedTuple):
+    """A page of the backup with its path relative to the wiki directory"""
+    path: Path
+    rel: Path
+    rel_str: str  # key of document_map and the migration log
+    parts: Tuple[str, ...]
+    stem: str
+    depth: int  # directory levels above the file
 
-# Rate limit sleeps (seconds)
-RATE_LIMIT_SLEEP_CREATE = 0.6
-RATE_LIMIT_SLEEP_MOVE = 0.6
-RATE_LIMIT_SLEEP_UPDATE = 0.6
-RATE_LIMIT_SLEEP_UPLOAD = 0.6
 
 class WikiJSToOutlineConverter:
+    # File extension -> MIME type, shared by all uploads
+    _MIME_CACHE: Dict[str, str] = {}
+
     def __init__(self, outline_url: str, api_token: str, wiki_dir: str):
         self.outline_url = outline_url.rstrip('/')
         self.api_token = api_token
@@ -37,39 +316,122 @@ class WikiJSToOutlineConverter:
             "User-Agent": "curl/8.7.1",
             "Accept": "*/*",
             "Content-Type": "application/json",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Connection": "keep-alive",
         })
+        adapter = _StreamingAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_SIZE,
+            pool_block=HTTP_POOL_BLOCK,
+            max_retries=_RefusedRequestRetry(
+                total=HTTP_MAX_RETRIES,
+                connect=HTTP_MAX_RETRIES,
+                read=0,
+                other=0,
+                backoff_factor=HTTP_RETRY_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                allowed_methods=["HEAD", "GET", "POST"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Paces write calls instead of sleeping after each of them
+        self._write_rate_limiter = _RateLimiter(WRITE_REQUESTS_PER_SECOND, WRITE_REQUESTS_BURST)
 
         # Maps to track created documents and their new URLs
         self.document_map: Dict[str, str] = {}  # old_path -> new_document_id
-        self.url_map: Dict[str, str] = {}  # old_url -> new_url
+        self._doc_by_stem: Dict[str, str] = {}  # old_path without .md -> new_document_id
+        self._doc_map_by_parts: Dict[Tuple[str, ...], str] = {}  # old_path parts without .md -> new_document_id
         self.collection_id: Optional[str] = None
 
+        # Uploaded attachments: (resolved path, size, mtime_ns) -> attachment URL
+        self._attachment_cache: Dict[Tuple[str, int, int], str] = {}
+
+        # Uploaded attachments by content: blake2b digest -> attachment URL. The
+        # future is registered before the upload starts, so concurrent pages
+        # embedding the same file wait for that upload instead of repeating it
+        self._upload_cache: Dict[bytes, Future] = {}
+        self._upload_lock = threading.Lock()
+
+        # Resolved link targets: (linking page or None for absolute paths, link path) -> file
+        self._resolve_cache: Dict[Tuple[Optional[Path], str], Path] = {}
+        self._exists_cache: Dict[Path, bool] = {}  # resolved link target -> exists
+
+        # Created document text that may contain crosslinks: old_path -> text
+        self._created_text: Dict[str, str] = {}
+
+        # Guards the document maps while documents are created concurrently
+        self._document_lock = threading.Lock()
+
         # File-level log: md_relative_path -> events
-        self.file_log: Dict[str, Dict[str, List[Dict]]] = {}
-
-        def _init_file_log(rel: str):
-            return {
-                'document': [],      # create/update events
-                'attachments': [],   # uploads per image/file
-                'move': [],          # hierarchy moves
-                'crosslinks': []     # crosslink updates
-            }
+        self.file_log: Dict[str, Dict[str, List[Dict]]] = defaultdict(lambda: {
+            'document': [],      # create/update events
+            'attachments': [],   # uploads per image/file
+            'move': [],          # hierarchy moves
+            'crosslinks': []     # crosslink updates
+        })
+        self._log_lock = threading.Lock()
+
+        # Document creation check remembered from a previous run
+        self._cache_file = self.wiki_dir / CACHE_FILENAME
+        self._token_fingerprint = hashlib.sha256(api_token.encode('utf-8')).hexdigest()[:16]
+        self._auth_failed = False  # a documents.create call was rejected with 401/403
 
-        self._init_file_log = _init_file_log
+    def _load_cache(self) -> Dict:
+        """Load the cached check results for this Outline instance, if any"""
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(self.outline_url)
+            return entry if isinstance(entry, dict) else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_cache(self, entry: Optional[Dict]):
+        """Persist the check results for this Outline instance (None drops them)"""
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                cache = {}
+        except (OSError, ValueError):
+            cache = {}
+
+        if entry is None:
+            cache.pop(self.outline_url, None)
+        else:
+            cache[self.outline_url] = entry
+        try:
+            with open(self._cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            logger.warning("Could not write %s: %s", self._cache_file, e)
 
     def _resolve_file_path(self, file_path: str, base_path: Path) -> Path:
         """Resolve relative or absolute file paths consistently"""
-        if file_path.startswith('/'):
-            return self.wiki_dir / file_path.lstrip('/')
-        else:
-            return base_path.parent / file_path
+        # Absolute paths (e.g. a shared /images/logo.png) resolve the same from every page
+        key = (None if file_path.startswith('/') else base_path, file_path)
+        resolved = self._resolve_cache.get(key)
+        if resolved is None:
+            if file_path.startswith('/'):
+                resolved = self.wiki_dir / file_path.lstrip('/')
+            else:
+                resolved = base_path.parent / file_path
+            self._resolve_cache[key] = resolved
+        return resolved
+
+    def _file_exists(self, file_path: Path) -> bool:
+        """Check whether a resolved link target exists, stat()ing each path only once"""
+        exists = self._exists_cache.get(file_path)
+        if exists is None:
+            exists = self._exists_cache[file_path] = file_path.exists()
+        return exists
 
     def get_collections(self) -> List[Dict]:
         """Get all collections from Outline"""
         try:
-            response = self.session.post(f'{self.outline_url}/api/collections.list')
+            response = self.session.post(f'{self.outline_url}/api/collections.list', timeout=HTTP_TIMEOUT)
             if response.status_code == 401:
                 print(f"Authentication failed. Please check your API token.")
                 print(f"URL: {self.outline_url}/api/collections.list")
@@ -90,21 +452,24 @@ class WikiJSToOutlineConverter:
             'name': name,
             'description': description
         }
-        response = self.session.post(f'{self.outline_url}/api/collections.create', json=data)
+        response = self.session.post(f'{self.outline_url}/api/collections.create', json=data, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         return response.json()['data']['id']
 
     def _log_event(self, rel_path: str, category: str, status: str, message: str, extra: Optional[Dict] = None):
-        if rel_path not in self.file_log:
-            self.file_log[rel_path] = self._init_file_log(rel_path)
+        file_log = self.file_log.get(rel_path)
+        if file_log is None:
+            # A file's first events can come from several upload threads at once
+            with self._log_lock:
+                file_log = self.file_log[rel_path]
         entry = {'status': status, 'message': message}
         if extra:
             entry.update(extra)
-        self.file_log[rel_path][category].append(entry)
+        file_log[category].append(entry)
 
     def _handle_upload_error(self, md_rel_path: Optional[str], message: str, file_path: Path, extra: Optional[Dict] = None):
         """Helper method to handle upload errors consistently"""
-        print(f"  {message}")
+        logger.warning("  %s", message)
         if md_rel_path:
             log_extra = {'file': str(file_path)}
             if extra:
@@ -118,29 +483,85 @@ class WikiJSToOutlineConverter:
         except Exception:
             pass
 
+    def _mime_for(self, file_path: Path) -> str:
+        """MIME type of a file by its extension, cached per extension"""
+        suffix = file_path.suffix.lower()
+        mime_type = self._MIME_CACHE.get(suffix)
+        if mime_type is None:
+            mime_type = self._MIME_CACHE[suffix] = mimetypes.guess_type('file' + suffix)[0] or 'application/octet-stream'
+        return mime_type
+
     def upload_attachment(self, file_path: Path, md_rel_path: Optional[str] = None) -> str:
+        """Upload an image/attachment to Outline, reusing the URL if the same file was already uploaded"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return self._upload_attachment_file(file_path, md_rel_path)
+
+        # The same logo/screenshot is typically embedded by many pages; any path
+        # resolving to an unchanged file maps to the attachment uploaded first
+        key = (str(file_path.resolve()), st.st_size, st.st_mtime_ns)
+        attachment_url = self._attachment_cache.get(key)
+        if attachment_url is None:
+            # Copies of the same file (e.g. a logo saved under every page's
+            # folder) are found by their content
+            digest = hashlib.blake2b()
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            content_key = digest.digest()
+            with self._upload_lock:
+                upload = self._upload_cache.get(content_key)
+                first = upload is None
+                if first:
+                    upload = self._upload_cache[content_key] = Future()
+            if first:
+                try:
+                    attachment_url = self._upload_attachment_file(file_path, md_rel_path, st)
+                except BaseException as e:
+                    # Waiting pages fail with this upload; later ones try again
+                    with self._upload_lock:
+                        del self._upload_cache[content_key]
+                    upload.set_exception(e)
+                    raise
+                upload.set_result(attachment_url)
+                self._attachment_cache[key] = attachment_url
+                return attachment_url
+            attachment_url = upload.result()
+            self._attachment_cache[key] = attachment_url
+
+        logger.debug("  ✓ Attachment already uploaded: %s", file_path.name)
+        if md_rel_path:
+            self._log_event(md_rel_path, 'attachments', 'success', 'Reused uploaded attachment', {
+                'file': str(file_path), 'url': attachment_url
+            })
+        return attachment_url
+
+    def _upload_attachment_file(self, file_path: Path, md_rel_path: Optional[str] = None, st: Optional[os.stat_result] = None) -> str:
         """Upload an image/attachment to Outline using attachments API"""
-        if not file_path.exists():
-            if md_rel_path:
-                self._log_event(md_rel_path, 'attachments', 'failed', 'File not found', {'file': str(file_path)})
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                if md_rel_path:
+                    self._log_event(md_rel_path, 'attachments', 'failed', 'File not found', {'file': str(file_path)})
+                raise FileNotFoundError(f"File not found: {file_path}")
 
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if not mime_type:
-            mime_type = 'application/octet-stream'
+        mime_type = self._mime_for(file_path)
 
         # Get file size
-        file_size = file_path.stat().st_size
+        file_size = st.st_size
 
         # Check Outline's 1MB limit - compress if needed
         max_outline_size = 1000000 * 10
         if file_size > max_outline_size:
-            print(f"  File too large ({file_size:,} bytes), compressing for attachment upload")
+            logger.debug("  File too large (%s bytes), compressing for attachment upload", f"{file_size:,}")
             compressed_path = self.compress_image(file_path, max_outline_size)
-            if compressed_path and compressed_path.stat().st_size <= max_outline_size:
-                print(f"  ✓ Compressed: {file_size:,} → {compressed_path.stat().st_size:,} bytes")
+            compressed_st = compressed_path.stat() if compressed_path else None
+            if compressed_st and compressed_st.st_size <= max_outline_size:
+                logger.debug("  ✓ Compressed: %s → %s bytes", f"{file_size:,}", f"{compressed_st.st_size:,}")
                 try:
-                    result = self.upload_attachment(compressed_path, md_rel_path)
+                    result = self._upload_attachment_file(compressed_path, md_rel_path, compressed_st)
                     self._cleanup_temp_file(compressed_path)
                     return result
                 except Exception:
@@ -149,7 +570,7 @@ class WikiJSToOutlineConverter:
             # If compression did not succeed, continue with original file upload
 
         # Upload via attachments API
-        print(f"  Uploading attachment: {file_path.name} ({file_size:,} bytes)")
+        logger.debug("  Uploading attachment: %s (%s bytes)", file_path.name, f"{file_size:,}")
 
         try:
             # Step 1: Create attachment entry
@@ -159,7 +580,8 @@ class WikiJSToOutlineConverter:
                 'size': file_size
             }
 
-            response = self.session.post(f'{self.outline_url}/api/attachments.create', json=create_data)
+            self._write_rate_limiter.acquire()
+            response = self.session.post(f'{self.outline_url}/api/attachments.create', json=create_data, timeout=HTTP_TIMEOUT)
 
             if response.status_code != 200:
                 self._handle_upload_error(md_rel_path, f"Failed to create attachment: {response.status_code} - {response.text}",
@@ -179,16 +601,17 @@ class WikiJSToOutlineConverter:
             if upload_url.startswith('/'):
                 upload_url = f"{self.outline_url.rstrip('/')}{upload_url}"
 
-            print(f"  Uploading to: {upload_url}")
+            logger.debug("  Uploading to: %s", upload_url)
 
             with open(file_path, 'rb') as f:
-                files = {'file': (file_path.name, f, mime_type)}
+                # The body is streamed from the file instead of being assembled in memory
+                body = MultipartFileStream(form_data, 'file', f, file_path.name, mime_type)
 
-                # For Outline's local storage, include authorization header
-                upload_headers = {'Authorization': f'Bearer {self.api_token}'}
+                # The session already sends the bearer token Outline's local storage needs
+                upload_headers = {'Content-Type': body.content_type}
 
                 # Try multipart form upload
-                upload_response = requests.post(upload_url, data=form_data, files=files, headers=upload_headers)
+                upload_response = self.session.post(upload_url, data=body, headers=upload_headers, timeout=HTTP_TIMEOUT)
 
                 if upload_response.status_code in [200, 201, 204]:
                     # Upload successful, return attachment URL
@@ -196,12 +619,11 @@ class WikiJSToOutlineConverter:
                         attachment_url = attachment['url']
                         if attachment_url.startswith('/'):
                             attachment_url = f"{self.outline_url.rstrip('/')}{attachment_url}"
-                        print(f"  ✓ Attachment uploaded: {attachment['name']}")
+                        logger.debug("  ✓ Attachment uploaded: %s", attachment['name'])
                         if md_rel_path:
                             self._log_event(md_rel_path, 'attachments', 'success', 'Uploaded attachment', {
                                 'file': str(file_path), 'url': attachment_url
                             })
-                        time.sleep(RATE_LIMIT_SLEEP_UPLOAD)
                         return attachment_url
                     else:
                         self._handle_upload_error(md_rel_path, "No attachment URL in response", file_path)
@@ -215,26 +637,16 @@ class WikiJSToOutlineConverter:
             self._handle_upload_error(md_rel_path, f"Attachment upload failed: {e}", file_path)
             raise
 
-    def handle_large_image(self, file_path: Path, max_size: int) -> str:
-        """Handle large images by compressing them"""
-        try:
-            # Try to compress the image first
-            compressed_path = self.compress_image(file_path, max_size)
-            if compressed_path and compressed_path.stat().st_size <= max_size:
-                print(f"  ✓ Compressed {file_path.name}: {file_path.stat().st_size:,} → {compressed_path.stat().st_size:,} bytes")
-                # Use base64 embedding for the compressed version
-                result = self.upload_attachment_base64_fallback(compressed_path)
-                # Clean up temporary file
-                self._cleanup_temp_file(compressed_path)
-                return result
-
-            # If compression didn't work enough, provide placeholder
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)
-            return f"*Large Image: {file_path.name} ({file_size_mb:.1f}MB - too large to embed)*"
+    def _upload_attachments_parallel(self, files: List[Path], md_rel_path: str) -> Dict[Path, object]:
+        """Upload files concurrently; maps each file to its attachment URL or the exception raised"""
+        def upload(file_path: Path):
+            try:
+                return self.upload_attachment(file_path, md_rel_path)
+            except Exception as e:
+                return e
 
-        except Exception as e:
-            print(f"  Large image handling failed: {e}")
-            return f"*Image: {file_path.name} (processing failed)*"
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            return dict(zip(files, executor.map(upload, files)))
 
     def _create_temp_image_file(self, suffix: str = '.jpg') -> Tuple[int, Path]:
         """Create a temporary image file and return file descriptor and path"""
@@ -242,13 +654,40 @@ class WikiJSToOutlineConverter:
         temp_fd, temp_name = tempfile.mkstemp(suffix=suffix)
         return temp_fd, Path(temp_name)
 
-    def _save_and_check_size(self, img, temp_path: Path, temp_fd: int, target_size: int, quality: int) -> bool:
-        """Save image and check if it meets size requirements"""
-        try:
-            img.save(temp_path, 'JPEG', quality=quality, optimize=True)
-            return temp_path.stat().st_size <= target_size
-        finally:
-            os.close(temp_fd)
+    def _compression_format(self, img, file_path: Path):
+        """Pick the output format for a compressed image: (image, PIL format, suffix)"""
+        from PIL import ImageOps
+
+        # EXIF and ICC metadata are stripped on encode, so the EXIF orientation of
+        # phone photos is applied to the pixels first
+        if img.getexif().get(0x0112, 1) != 1:
+            img = ImageOps.exif_transpose(img)
+
+        # Screenshots, diagrams and logos keep transparency and compress better
+        # as WebP; photographic JPEGs stay JPEG
+        if img.mode in ('RGBA', 'P', 'LA') or file_path.suffix.lower() in ('.png', '.webp'):
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            return img, 'WEBP', '.webp'
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        return img, 'JPEG', '.jpg'
+
+    def _encode_image(self, img, fmt: str, quality: int) -> io.BytesIO:
+        """Encode an image in memory, without EXIF or ICC metadata"""
+        buf = io.BytesIO()
+        if fmt == 'WEBP':
+            img.save(buf, 'WEBP', quality=quality, method=WEBP_METHOD, exif=b'', icc_profile=None)
+        else:
+            img.save(buf, 'JPEG', quality=quality, optimize=True, progressive=True, exif=b'', icc_profile=None)
+        return buf
+
+    def _write_temp_image(self, data: io.BytesIO, suffix: str = '.jpg') -> Path:
+        """Write encoded image bytes to a new temporary file"""
+        temp_fd, temp_path = self._create_temp_image_file(suffix)
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(data.getbuffer())
+        return temp_path
 
     def compress_image(self, file_path: Path, target_size: int) -> Optional[Path]:
         """Compress image to fit within target size"""
@@ -260,32 +699,37 @@ class WikiJSToOutlineConverter:
                 return None
 
             with Image.open(file_path) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
-
-                # Start with 85% quality for JPEG
-                quality = 85
-
-                while quality > 20:  # Don't go below 20% quality
-                    # Create temporary file
-                    temp_fd, temp_path = self._create_temp_image_file()
-
-                    if self._save_and_check_size(img, temp_path, temp_fd, target_size, quality):
-                        return temp_path
+                img, fmt, suffix = self._compression_format(img, file_path)
+
+                # Borderline files usually fit at the top quality: one encode, no search
+                qualities = range(JPEG_QUALITY_MIN, JPEG_QUALITY_MAX + 1, JPEG_QUALITY_STEP)
+                buf = self._encode_image(img, fmt, qualities[-1])
+                if buf.tell() <= target_size:
+                    return self._write_temp_image(buf, suffix)
+
+                # Binary search for the highest lower quality that fits, encoding in memory
+                lo, hi = 0, len(qualities) - 2
+                best = None
+                while lo <= hi:
+                    mid = (lo + hi) // 2
+                    buf = self._encode_image(img, fmt, qualities[mid])
+                    if buf.tell() <= target_size:
+                        best = buf
+                        lo = mid + 1
+                    else:
+                        hi = mid - 1
 
-                    # Too big, try lower quality
-                    quality -= 15
-                    self._cleanup_temp_file(temp_path)
+                if best is not None:
+                    return self._write_temp_image(best, suffix)
 
                 # If we get here, even lowest quality is too big, try resizing
                 return self.resize_and_compress_image(file_path, target_size)
 
         except ImportError:
-            print(f"  PIL not available for compression. Install with: pip install Pillow")
+            logger.warning("  PIL not available for compression. Install with: pip install Pillow")
             return None
         except Exception as e:
-            print(f"  Compression failed: {e}")
+            logger.warning("  Compression failed: %s", e)
             return None
 
     def resize_and_compress_image(self, file_path: Path, target_size: int) -> Optional[Path]:
@@ -294,58 +738,34 @@ class WikiJSToOutlineConverter:
             from PIL import Image
 
             with Image.open(file_path) as img:
-                if img.mode in ('RGBA', 'P'):
-                    img = img.convert('RGB')
-
-                # Start with 50% of original size
-                scale_factor = 0.5
-                quality = 75
+                img, fmt, suffix = self._compression_format(img, file_path)
 
-                while scale_factor > 0.1:  # Don't resize smaller than 10%
-                    # Resize image
-                    new_size = (int(img.width * scale_factor), int(img.height * scale_factor))
-                    resized = img.resize(new_size, Image.Resampling.LANCZOS)
+                # Estimate the scale from the byte budget (encoded size grows with the
+                # pixel count) and resample once; a second, smaller resample corrects
+                # an estimate that was too optimistic
+                width, height = img.size
+                ratio = min(1.0, math.sqrt(target_size / file_path.stat().st_size) * 0.9)
+                quality = WEBP_QUALITY if fmt == 'WEBP' else 75
 
-                    # Try to compress to target size
-                    temp_fd, temp_path = self._create_temp_image_file()
+                for _ in range(2):
+                    ratio = max(ratio, 0.1)  # Don't resize smaller than 10%
+                    img.thumbnail((max(1, int(width * ratio)), max(1, int(height * ratio))), Image.Resampling.LANCZOS)
 
-                    if self._save_and_check_size(resized, temp_path, temp_fd, target_size, quality):
-                        print(f"    Resized to {new_size[0]}x{new_size[1]} at {quality}% quality")
-                        return temp_path
+                    buf = self._encode_image(img, fmt, quality)
+                    if buf.tell() <= target_size:
+                        logger.debug("    Resized to %sx%s at %s%% quality", img.width, img.height, quality)
+                        return self._write_temp_image(buf, suffix)
 
-                    # Still too big, try smaller
-                    scale_factor -= 0.1
-                    quality = max(30, quality - 10)  # Don't go below 30% quality
-                    self._cleanup_temp_file(temp_path)
+                    # Still too big, shrink by the remaining overshoot
+                    ratio *= math.sqrt(target_size / buf.tell()) * 0.9
+                    quality -= 10
 
             return None
 
         except Exception as e:
-            print(f"  Resize and compress failed: {e}")
+            logger.warning("  Resize and compress failed: %s", e)
             return None
 
-    def upload_attachment_base64_fallback(self, file_path: Path) -> str:
-        """Fallback: Embed image as base64 data URL (per Outline docs)"""
-        try:
-            import base64
-
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if not mime_type:
-                mime_type = 'application/octet-stream'
-
-            with open(file_path, 'rb') as f:
-                file_content = f.read()
-
-            file_b64 = base64.b64encode(file_content).decode('utf-8')
-            data_url = f"data:{mime_type};base64,{file_b64}"
-
-            print(f"  Using base64 fallback for {file_path.name}")
-            return data_url
-
-        except Exception as e:
-            print(f"  Base64 fallback failed: {e}")
-            return str(file_path)
-
     def create_document(self, title: str, content: str) -> Dict:
         """Create a document in Outline as published"""
         data = {
@@ -355,7 +775,8 @@ class WikiJSToOutlineConverter:
             'publish': True  # Create as published, no need to publish later
         }
 
-        response = self.session.post(f'{self.outline_url}/api/documents.create', json=data)
+        self._write_rate_limiter.acquire()
+        response = self.session.post(f'{self.outline_url}/api/documents.create', json=data, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         return response.json()['data']
 
@@ -393,21 +814,15 @@ class WikiJSToOutlineConverter:
                     f.write("\n")
 
         # CSV of failures only
-        with open(csv_path, 'w', encoding='utf-8') as f:
-            f.write("file,category,status,message,extra\n")
-            for rel_path, sections in self.file_log.items():
-                for category, events in sections.items():
-                    for e in events:
-                        if e.get('status') != 'failed':
-                            continue
-                        extra_parts = []
-                        for k in ('file','url','id'):
-                            if k in e:
-                                extra_parts.append(f"{k}={e[k]}")
-                        extra = '; '.join(extra_parts)
-                        # Escape commas in message
-                        msg = e.get('message','').replace(',', ';')
-                        f.write(f"{rel_path},{category},{e.get('status')},{msg},{extra}\n")
+        rows = [(rel_path, category, e.get('status'), e.get('message', ''),
+                 '; '.join(f"{k}={e[k]}" for k in ('file', 'url', 'id') if k in e))
+                for rel_path, sections in self.file_log.items()
+                for category, events in sections.items()
+                for e in events if e.get('status') == 'failed']
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['file', 'category', 'status', 'message', 'extra'])
+            writer.writerows(rows)
 
     def move_document(self, document_id: str, parent_id: Optional[str] = None) -> bool:
         """Move a document to a new parent using documents.move API"""
@@ -419,59 +834,83 @@ class WikiJSToOutlineConverter:
         if parent_id:
             data['parentDocumentId'] = parent_id
 
-        response = self.session.post(f'{self.outline_url}/api/documents.move', json=data)
+        self._write_rate_limiter.acquire()
+        response = self.session.post(f'{self.outline_url}/api/documents.move', json=data, timeout=HTTP_TIMEOUT)
 
         if response.status_code != 200:
-            print(f"  Failed to move document: {response.status_code} - {response.text}")
+            logger.warning("  Failed to move document: %s - %s", response.status_code, response.text)
             return False
 
         return True
 
     def parse_markdown_file(self, file_path: Path) -> Tuple[Dict, str]:
         """Parse WikiJS markdown file and extract frontmatter and content"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Map the file and decode the frontmatter and the body separately, so the
+        # body is decoded once instead of read whole and then sliced again
+        frontmatter_text = None
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    body_start = 0
+                    if mm[:3] == b'---':
+                        end = mm.find(b'---', 3)
+                        if end != -1:
+                            frontmatter_text = _decode_text(mm[3:end]).strip()
+                            body_start = end + 3
+                    content = _decode_text(mm[body_start:])
+            else:
+                content = ''
 
         # Extract YAML frontmatter
         frontmatter = {}
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                frontmatter_text = parts[1].strip()
-                content = parts[2].strip()
-
-                # Simple YAML parsing for basic fields
-                for line in frontmatter_text.split('\n'):
+        if frontmatter_text is not None:
+            content = content.strip()
+            lines = frontmatter_text.splitlines()
+
+            # WikiJS writes one unquoted "key: value" per line, which a YAML parser
+            # would misread (titles containing ": " or starting with "#"); only
+            # nested lists and block values are handed to the YAML parser
+            if any(line[:1] in (' ', '\t', '-') for line in lines):
+                try:
+                    parsed = yaml.load(frontmatter_text, Loader=YamlLoader)
+                except yaml.YAMLError:
+                    parsed = None
+                if isinstance(parsed, dict):
+                    frontmatter = parsed
+
+            # Simple YAML parsing for basic fields
+            if not frontmatter:
+                for line in lines:
                     if ':' in line:
                         key, value = line.split(':', 1)
                         frontmatter[key.strip()] = value.strip()
 
         return frontmatter, content
 
-    def get_page_hierarchy(self) -> List[Tuple[Path, int]]:
-        """Get all markdown files sorted by dependency order"""
+    @cached_property
+    def md_files(self) -> List[MarkdownFile]:
+        """All markdown pages of the backup, from a single walk of the wiki directory"""
         md_files = []
-
         for md_file in self.wiki_dir.rglob('*.md'):
             if md_file.name == 'README.md':
                 continue
 
             relative_path = md_file.relative_to(self.wiki_dir)
-            depth = len(relative_path.parts) - 1  # -1 because filename doesn't count as depth
+            parts = relative_path.parts
+            md_files.append(MarkdownFile(md_file, relative_path, str(relative_path), parts, relative_path.stem, len(parts) - 1))
 
-            md_files.append((md_file, depth))
+        return md_files
 
+    def get_page_hierarchy(self) -> List[MarkdownFile]:
+        """Get all markdown files sorted by dependency order"""
         # Sort by dependency order: parents must be created before children
-        def sort_key(item):
-            file_path, _ = item
-            relative_path = file_path.relative_to(self.wiki_dir)
-
+        def sort_key(md_file: MarkdownFile):
             # Create a sort key that ensures parents come before children
             # For hw-development/hw-documentation/tests.md:
             # - First sort by each path component level
             # - Then by the filename itself
-            path_parts = relative_path.parts[:-1]  # Directory parts only
-            filename = relative_path.stem
+            path_parts = md_file.parts[:-1]  # Directory parts only
+            filename = md_file.stem
 
             # Create hierarchical sort key
             sort_parts = []
@@ -482,54 +921,16 @@ class WikiJSToOutlineConverter:
 
             return sort_parts
 
-        md_files.sort(key=sort_key)
+        ordered = sorted(self.md_files, key=sort_key)
 
         # Debug: print the order
         print("File processing order:")
-        for i, (file_path, depth) in enumerate(md_files[:10]):  # Show first 10
-            rel_path = file_path.relative_to(self.wiki_dir)
-            print(f"  {i+1:2d}. {rel_path} (depth: {depth})")
-        if len(md_files) > 10:
-            print(f"  ... and {len(md_files) - 10} more files")
-
-        return md_files
-
-    def build_wiki_tree(self) -> Dict:
-        """Build a tree structure representing WikiJS hierarchy"""
-        tree = {}
+        for i, md_file in enumerate(ordered[:10]):  # Show first 10
+            print(f"  {i+1:2d}. {md_file.rel} (depth: {md_file.depth})")
+        if len(ordered) > 10:
+            print(f"  ... and {len(ordered) - 10} more files")
 
-        for md_file in self.wiki_dir.rglob('*.md'):
-            if md_file.name == 'README.md':
-                continue
-
-            relative_path = md_file.relative_to(self.wiki_dir)
-            path_parts = relative_path.parts
-
-            # Navigate/create tree structure
-            current_level = tree
-
-            for i, part in enumerate(path_parts[:-1]):  # Exclude the .md file itself
-                if part not in current_level:
-                    current_level[part] = {
-                        'children': {},
-                        'md_file': None  # Directory might not have corresponding .md file
-                    }
-                current_level = current_level[part]['children']
-
-            # Add the .md file
-            filename = path_parts[-1]  # The .md file
-            stem = relative_path.stem  # Filename without .md
-
-            if stem not in current_level:
-                current_level[stem] = {
-                    'children': {},
-                    'md_file': md_file
-                }
-            else:
-                # Update existing entry with md_file
-                current_level[stem]['md_file'] = md_file
-
-        return tree
+        return ordered
 
     def create_missing_parent(self, parent_path: Path) -> str:
         """Create a missing parent document to maintain hierarchy"""
@@ -543,48 +944,51 @@ class WikiJSToOutlineConverter:
         title = parent_path.stem.replace('_', ' ').replace('-', ' ').title()
         content = f"# {title}\n\nThis page was automatically created to maintain hierarchy structure."
 
-        print(f"  Creating missing parent: {relative_path}")
+        logger.debug("  Creating missing parent: %s", relative_path)
         document = self.create_document(title, content)
-        self.document_map[str(relative_path)] = document['id']
+        self._register_document(str(relative_path), document['id'])
 
         return document['id']
 
-    def get_parent_from_tree(self, file_path: Path, tree: Dict) -> Optional[str]:
-        """Find or create parent document ID using the tree structure"""
-        relative_path = file_path.relative_to(self.wiki_dir)
-        path_parts = relative_path.parts
+    def get_parent_document_id(self, md_file: MarkdownFile) -> Optional[str]:
+        """Find or create parent document ID from the file's directory path"""
+        relative_path = md_file.rel
+        path_parts = md_file.parts
 
         if len(path_parts) <= 1:  # Root level
             return None
 
-        # Navigate up the tree to find or create the parent
-        # For hw-development/hw-documentation/bringauto_pi-v4/tests/watchdog.md:
-        # Look for tests.md, then bringauto_pi-v4.md, then hw-documentation.md, then hw-development.md
-
-        current_path_parts = path_parts[:-1]  # Remove filename
-
-        while current_path_parts:
-            # Try to find parent.md in current directory
-            parent_relative_path = Path(*current_path_parts).with_suffix('.md')
-
-            parent_doc_id = self.document_map.get(str(parent_relative_path))
+        # Ancestors are the directory prefixes, e.g. for hw-development/hw-documentation/tests/watchdog.md:
+        # hw-development(.md), hw-development/hw-documentation(.md), hw-development/hw-documentation/tests(.md)
+        # Find the deepest one that already has a document
+        parent_doc_id = None
+        existing = 0
+        for i in range(len(path_parts) - 1, 0, -1):
+            parent_doc_id = self._doc_map_by_parts.get(path_parts[:i])
             if parent_doc_id:
-                print(f"  Found parent '{parent_relative_path}' for '{relative_path}'")
-                return parent_doc_id
+                existing = i
+                break
 
-            # If parent doesn't exist, create it
-            parent_file_path = self.wiki_dir / parent_relative_path
-            parent_doc_id = self.create_missing_parent(parent_file_path)
+        if existing == len(path_parts) - 1:
+            logger.debug("  Found parent '%s.md' for '%s'", Path(*path_parts[:existing]), relative_path)
+            return parent_doc_id
 
-            # After creating this parent, it might also need a parent - recursively handle this
-            parent_parent_id = self.get_parent_from_tree(parent_file_path, tree)
-            if parent_parent_id:
-                print(f"  Moving created parent '{parent_relative_path}' under its parent")
-                self.move_document(parent_doc_id, parent_parent_id)
+        # Create the missing ancestors below it, each moved under the previous one
+        for i in range(existing + 1, len(path_parts)):
+            parent_relative_path = Path(*path_parts[:i - 1], path_parts[i - 1] + '.md')
+            ancestor_id = parent_doc_id
+            parent_doc_id = self.create_missing_parent(self.wiki_dir / parent_relative_path)
+            if ancestor_id:
+                logger.debug("  Moving created parent '%s' under its parent", parent_relative_path)
+                self.move_document(parent_doc_id, ancestor_id)
 
-            return parent_doc_id
+        return parent_doc_id
 
-        return None
+    def _register_document(self, rel_path: str, doc_id: str):
+        """Record the Outline document created for a WikiJS page"""
+        self.document_map[rel_path] = doc_id
+        self._doc_by_stem[rel_path.removesuffix('.md')] = doc_id
+        self._doc_map_by_parts[Path(rel_path.removesuffix('.md')).parts] = doc_id
 
     def update_crosslinks(self, content: str) -> str:
         """Update WikiJS crosslinks to Outline format"""
@@ -593,32 +997,67 @@ class WikiJSToOutlineConverter:
             link_url = match.group(2)
 
             # Handle internal links (starting with /en/ or just /)
-            if link_url.startswith('/en/'):
-                page_path = link_url[4:]  # Remove '/en/'
-            elif link_url.startswith('/'):
-                page_path = link_url[1:]   # Remove '/'
-            else:
+            if not link_url.startswith('/'):
                 return match.group(0)  # Keep external links unchanged
+            page_path = link_url[4:] if link_url.startswith('/en/') else link_url[1:]
+            page_path, _, fragment = page_path.partition('#')
 
             # Find corresponding document
-            page_path_md = page_path + '.md'
-            if page_path_md in self.document_map:
-                doc_id = self.document_map[page_path_md]
-                return f'[{link_text}](/doc/{doc_id})'
+            doc_id = self._doc_by_stem.get(page_path)
+            if doc_id:
+                return f'[{link_text}](/doc/{doc_id}{"#" + fragment if fragment else ""})'
 
             return match.group(0)  # Keep original if not found
 
-        # Replace markdown links
-        content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', replace_link, content)
-        return content
+        # Replace markdown links: one scan of the text with a dict lookup per link,
+        # however many pages were migrated
+        return _MD_LINK_RE.sub(replace_link, content)
+
+    def update_attachment_links(self, content: str, base_path: Path) -> str:
+        """Update image links (including WikiJS-style with sizing and HTML img tags) and file links in content"""
+        # Every form needs a markdown link or an img tag
+        if '](' not in content and '<img' not in content:
+            return content
 
-    def update_image_links(self, content: str, base_path: Path) -> str:
-        """Update image links in content, including WikiJS-style with sizing and HTML img tags"""
         md_rel = str(base_path.relative_to(self.wiki_dir))
 
+        # Markdown images, HTML img tags and file links are found in one pass; the
+        # attributes of each tag are parsed once
+        matches = []
+        nested_img_paths = []
+        pos = 0
+        while True:
+            match = _ATTACHMENT_LINK_RE.search(content, pos)
+            if match is None:
+                break
+            if match.group('file') and not _is_file_link(match.group('file_target')):
+                # Not a file link: go on inside it, like a pattern listing the
+                # extensions would (an image can be the text of a link)
+                pos = match.start() + 1
+                continue
+            attrs = {}
+            if match.group('html'):
+                attrs = _tag_attrs(match.group('html'))
+            elif '<img' in match.group(0):
+                # img tags inside a markdown image or the text of a file link are
+                # rewritten within that link's replacement
+                nested_img_paths += [_tag_attrs(tag).get('src') for tag in _IMG_TAG_RE.findall(match.group(0))]
+            matches.append((match, attrs))
+            pos = match.end()
+
+        # Upload every distinct local image and file of the document in parallel
+        # up front; the substitution below then only looks up the results
+        link_paths = [match.group('md_target').split(' =')[0].strip() if match.group('md')
+                      else match.group('file_target') if match.group('file') else attrs.get('src')
+                      for match, attrs in matches] + nested_img_paths
+        link_files = [self._resolve_file_path(link_path, base_path) for link_path in link_paths
+                      if link_path and not link_path.startswith('http')]
+        link_files = [link_file for link_file in dict.fromkeys(link_files) if self._file_exists(link_file)]
+        uploads = self._upload_attachments_parallel(link_files, md_rel) if link_files else {}
+
         def replace_markdown_image(match):
-            alt_text = match.group(1)
-            img_path_with_params = match.group(2)
+            alt_text = match.group('md_alt')
+            img_path_with_params = match.group('md_target')
 
             # Split path from WikiJS sizing parameters (e.g., " =480x")
             img_path = img_path_with_params.split(' =')[0].strip()
@@ -626,190 +1065,316 @@ class WikiJSToOutlineConverter:
             if ' =' in img_path_with_params:
                 size_params = ' =' + img_path_with_params.split(' =', 1)[1]
 
-            print(f"    Processing markdown image: {img_path}")
+            logger.debug("    Processing markdown image: %s", img_path)
             if size_params:
-                print(f"      Size params: {size_params}")
+                logger.debug("      Size params: %s", size_params)
 
-            return self._process_image_path(img_path, alt_text, base_path, md_rel, match.group(0))
+            return self._process_image_path(img_path, alt_text, base_path, md_rel, match.group(0), uploads=uploads)
 
-        def replace_html_image(match):
-            # Extract src, alt, and other attributes from HTML img tag
+        def replace_html_image(match, attrs):
+            # Take src, alt, and other attributes from the parsed HTML img tag
             img_tag = match.group(0)
-            src_match = re.search(r'src=["\']([^"\']+)["\']', img_tag)
-            alt_match = re.search(r'alt=["\']([^"\']*)["\']', img_tag)
+            img_path = attrs.get('src')
 
-            if not src_match:
+            if not img_path:
                 return img_tag  # Keep original if no src found
 
-            img_path = src_match.group(1)
-            alt_text = alt_match.group(1) if alt_match else ""
-
-            print(f"    Processing HTML image: {img_path}")
+            alt_text = attrs.get('alt', "")
 
-            # Extract other attributes like height, width for potential preservation
-            height_match = re.search(r'height=["\']([^"\']+)["\']', img_tag)
-            width_match = re.search(r'width=["\']([^"\']+)["\']', img_tag)
+            logger.debug("    Processing HTML image: %s", img_path)
 
-            uploaded_url = self._process_image_path(img_path, alt_text, base_path, md_rel, img_tag, return_url_only=True)
+            uploaded_url = self._process_image_path(img_path, alt_text, base_path, md_rel, img_tag, return_url_only=True, uploads=uploads)
 
             if uploaded_url != img_tag:  # If upload succeeded
                 # Convert to markdown format, optionally preserving size info in alt text
-                size_info = ""
-                if height_match or width_match:
-                    size_parts = []
-                    if width_match:
-                        size_parts.append(f"width={width_match.group(1)}")
-                    if height_match:
-                        size_parts.append(f"height={height_match.group(1)}")
-                    size_info = f" ({', '.join(size_parts)})"
+                size_parts = [f"{name}={attrs[name]}" for name in ('width', 'height') if attrs.get(name)]
+                size_info = f" ({', '.join(size_parts)})" if size_parts else ""
 
                 return f'![{alt_text}{size_info}]({uploaded_url})'
 
             return img_tag  # Keep original if upload failed
 
-        # Replace markdown image references
-        content = re.sub(r'!\[([^]]*)\]\(([^)]+(?:\s*=\w*)?)\)', replace_markdown_image, content)
+        def replace_file_link(match):
+            link_text = match.group('file_text')
+            file_path = match.group('file_target')
+
+            logger.debug("    Processing file link: %s", file_path)
+
+            # Handle relative file paths
+            if not file_path.startswith('http'):
+                # Try to find the file
+                file_obj = self._resolve_file_path(file_path, base_path)
 
-        # Replace HTML img tags
-        content = re.sub(r'<img[^>]+>', replace_html_image, content)
+                if self._file_exists(file_obj):
+                    try:
+                        uploaded_url = uploads[file_obj]
+                        if isinstance(uploaded_url, Exception):
+                            raise uploaded_url
+                        return f'[{link_text}]({uploaded_url})'
+                    except Exception as e:
+                        self._log_event(md_rel, 'attachments', 'failed', f'file upload failed: {e}', {'file': str(file_obj)})
+                        logger.warning("Failed to upload file %s: %s", file_obj, e)
+                else:
+                    logger.warning("      File not found: %s", file_obj)
 
-        return content
+            return match.group(0)  # Keep original if upload fails
 
-    def _process_image_path(self, img_path: str, alt_text: str, base_path: Path, md_rel: str, fallback: str, return_url_only: bool = False) -> str:
-        """Process an image path and upload if needed"""
+        segments = []
+        last = 0
+        for match, attrs in matches:
+            segments.append(content[last:match.start()])
+            if match.group('html'):
+                segments.append(replace_html_image(match, attrs))
+                last = match.end()
+                continue
+            segment = replace_markdown_image(match) if match.group('md') else replace_file_link(match)
+            if '<img' in segment:
+                segment = _IMG_TAG_RE.sub(lambda tag: replace_html_image(tag, _tag_attrs(tag.group(0))), segment)
+            segments.append(segment)
+            last = match.end()
+        segments.append(content[last:])
+
+        return ''.join(segments)
+
+    def _process_image_path(self, img_path: str, alt_text: str, base_path: Path, md_rel: str, fallback: str, return_url_only: bool = False,
+                            uploads: Optional[Dict[Path, object]] = None) -> str:
+        """Process an image path and upload if needed (or take the result from uploads)"""
         # Handle relative image paths
         if not img_path.startswith('http'):
             # Try to find the image file
             img_file = self._resolve_file_path(img_path, base_path)
 
-            if img_file.exists():
+            if self._file_exists(img_file):
                 try:
-                    uploaded_url = self.upload_attachment(img_file, md_rel)
+                    if uploads is not None and img_file in uploads:
+                        uploaded_url = uploads[img_file]
+                        if isinstance(uploaded_url, Exception):
+                            raise uploaded_url
+                    else:
+                        uploaded_url = self.upload_attachment(img_file, md_rel)
                     if return_url_only:
                         return uploaded_url
                     return f'![{alt_text}]({uploaded_url})'
                 except Exception as e:
                     self._log_event(md_rel, 'attachments', 'failed', f'image upload failed: {e}', {'file': str(img_file)})
-                    print(f"Failed to upload image {img_file}: {e}")
+                    logger.warning("Failed to upload image %s: %s", img_file, e)
             else:
-                print(f"      Image file not found: {img_file}")
+                logger.warning("      Image file not found: %s", img_file)
 
         return fallback  # Keep original if upload fails or external URL
 
     def convert_wikijs_blocks(self, content: str) -> str:
         """Convert WikiJS block extensions to Outline callouts"""
-        # Map WikiJS block types to Outline callout types
-        block_mapping = {
-            'is-warning': 'warning',
-            'is-danger': 'warning',
-            'is-info': 'info',
-            'is-success': 'tip',
-            'is-primary': 'info',
-            'is-secondary': 'info'
-        }
+        # Both block forms end in a {.is-...} class; most pages have none
+        if '{.is-' not in content:
+            return content
+
+        n = len(content)
+
+        # Blockquote followed by a block class, e.g. "> content\n{.is-warning}":
+        # scan line starts for a run of '>' lines, then skip whitespace (blank
+        # lines included) and look for the class
+        segments = []
+        emitted = 0
+        line_start = 0
+        while line_start < n:
+            if content[line_start] != '>':
+                # Jump straight to the next line that starts a blockquote
+                newline = content.find('\n>', line_start)
+                line_start = n if newline == -1 else newline + 1
+                continue
 
-        # Pattern to match WikiJS blocks: blockquote followed by {.class}
-        # Matches: > content\n{.is-warning}
-        def replace_block(match):
-            blockquote_content = match.group(1).strip()
-            block_class = match.group(2)
+            run_end = line_start
+            while run_end < n and content[run_end] == '>':
+                newline = content.find('\n', run_end)
+                run_end = n if newline == -1 else newline + 1
+
+            class_start = run_end
+            while class_start < n and content[class_start].isspace():
+                class_start += 1
+            block = _block_class_at(content, class_start)
+            if block is None:
+                line_start = run_end
+                continue
+            block_class, block_end = block
 
             # Remove the '>' prefix from each line and clean up
-            lines = blockquote_content.split('\n')
             cleaned_lines = []
-            for line in lines:
+            for line in content[line_start:run_end].strip().split('\n'):
                 line = line.strip()
                 if line.startswith('>'):
                     line = line[1:].strip()
                 if line:  # Only add non-empty lines
                     cleaned_lines.append(line)
 
-            content_text = '\n'.join(cleaned_lines)
-
             # Get the appropriate Outline callout type
-            outline_type = block_mapping.get(block_class, 'info')
-
-            print(f"    Converting WikiJS block {{{block_class}}} to Outline :::{outline_type}")
-
-            return f":::{outline_type}\n{content_text}\n:::"
-
-        # Match blockquote followed by block class on next line
-        # This handles both single-line and multi-line blockquotes
-        pattern = r'((?:^>.*(?:\n|$))+)\s*\{\.(' + '|'.join(block_mapping.keys()) + r')\}'
-        content = re.sub(pattern, replace_block, content, flags=re.MULTILINE)
+            outline_type = _BLOCK_MAPPING.get(block_class, 'info')
+
+            logger.debug("    Converting WikiJS block {%s} to Outline :::%s", block_class, outline_type)
+
+            segments.append(content[emitted:line_start])
+            segments.append(f":::{outline_type}\n" + '\n'.join(cleaned_lines) + "\n:::")
+            emitted = block_end
+            newline = content.find('\n', block_end)
+            line_start = n if newline == -1 else newline + 1
+
+        segments.append(content[emitted:])
+        content = ''.join(segments)
+        n = len(content)
+
+        # Also handle inline block syntax: a paragraph followed by {.is-warning},
+        # either on its own next line(s) or at the end of the same line. A class
+        # after the line wins over one inside it, and within a line the last one wins
+        segments = []
+        emitted = 0
+        pos = 0
+        while pos < n:
+            if content[pos] == '\n':
+                pos += 1
+                continue
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                line_end = n
+
+            class_start = line_end
+            while class_start < n and content[class_start].isspace():
+                class_start += 1
+            block = _block_class_at(content, class_start)
+            paragraph_end = line_end
+            if block is None:
+                class_start = content.rfind('{.', pos + 1, line_end)
+                while class_start != -1:
+                    block = _block_class_at(content, class_start)
+                    if block is not None:
+                        break
+                    class_start = content.rfind('{.', pos + 1, class_start)
+                paragraph_end = class_start
+            if block is None:
+                pos = line_end + 1
+                continue
+            block_class, block_end = block
 
-        # Also handle inline block syntax: {.is-warning} at the end of a paragraph
-        def replace_inline_block(match):
-            paragraph_content = match.group(1).strip()
-            block_class = match.group(2)
-            outline_type = block_mapping.get(block_class, 'info')
+            outline_type = _BLOCK_MAPPING.get(block_class, 'info')
 
-            print(f"    Converting inline WikiJS block {{{block_class}}} to Outline :::{outline_type}")
+            logger.debug("    Converting inline WikiJS block {%s} to Outline :::%s", block_class, outline_type)
 
-            return f":::{outline_type}\n{paragraph_content}\n:::"
+            segments.append(content[emitted:pos])
+            segments.append(f":::{outline_type}\n{content[pos:paragraph_end].strip()}\n:::")
+            emitted = pos = block_end
 
-        # Match paragraph followed by block class
-        inline_pattern = r'([^\n]+)\s*\{\.(' + '|'.join(block_mapping.keys()) + r')\}'
-        content = re.sub(inline_pattern, replace_inline_block, content, flags=re.MULTILINE)
+        segments.append(content[emitted:])
+        return ''.join(segments)
 
-        return content
+    def _convert_wikijs_blocks_cached(self, content: str) -> str:
+        """convert_wikijs_blocks, reusing the result of an earlier run for the same text"""
+        if '{.is-' not in content:
+            return content
 
-    def update_file_links(self, content: str, base_path: Path) -> str:
-        """Update file links (non-images) in content"""
-        md_rel = str(base_path.relative_to(self.wiki_dir))
+        digest = hashlib.blake2b(BLOCK_CONVERTER_VERSION + b'\0' + content.encode('utf-8'), digest_size=20)
+        cache_path = self.wiki_dir / BLOCK_CACHE_DIRNAME / digest.hexdigest()
+        try:
+            with open(cache_path, 'r', encoding='utf-8', newline='') as f:
+                return f.read()
+        except (OSError, ValueError):
+            pass
 
-        def replace_file_link(match):
-            link_text = match.group(1)
-            file_path = match.group(2)
+        converted = self.convert_wikijs_blocks(content)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            # Pages with the same text may be converted concurrently; each writes
+            # its own file and the rename keeps the cache entry whole
+            tmp_path = cache_path.with_name(f'{cache_path.name}.{threading.get_ident()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(converted)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("  Could not cache converted blocks: %s", e)
+        return converted
+
+    def _create_from_file(self, md_file: MarkdownFile) -> Optional[str]:
+        """Convert one markdown file and create its Outline document (first migration pass)"""
+        file_path, relative_path, rel_str = md_file.path, md_file.rel, md_file.rel_str
+        logger.debug("Processing: %s", relative_path)
 
-            print(f"    Processing file link: {file_path}")
+        try:
+            # Parse the markdown file
+            frontmatter, content = self.parse_markdown_file(file_path)
 
-            # Handle relative file paths
-            if not file_path.startswith('http'):
-                # Try to find the file
-                file_obj = self._resolve_file_path(file_path, base_path)
+            # Get title from frontmatter or filename
+            title = frontmatter.get('title')
+            if not title or not isinstance(title, str):
+                title = md_file.stem.replace('_', ' ').title()
 
-                if file_obj.exists():
-                    try:
-                        uploaded_url = self.upload_attachment(file_obj, md_rel)
-                        return f'[{link_text}]({uploaded_url})'
-                    except Exception as e:
-                        self._log_event(md_rel, 'attachments', 'failed', f'file upload failed: {e}', {'file': str(file_obj)})
-                        print(f"Failed to upload file {file_obj}: {e}")
-                else:
-                    print(f"      File not found: {file_obj}")
+            # Convert WikiJS block extensions to Outline callouts
+            content = self._convert_wikijs_blocks_cached(content)
 
-            return match.group(0)  # Keep original if upload fails
+            # Update image and file links
+            content = self.update_attachment_links(content, file_path)
 
-        # Replace file links - pattern for markdown links to files with extensions
-        file_pattern = r'\[([^\]]*)\]\(([^)]*\.(?:xml|txt|csv|json|pdf|doc|docx|xls|xlsx|ppt|pptx|zip|rar|7z|yaml|yml|drawio)(?:\s*=[^)]*)?)\)'
-        content = re.sub(file_pattern, replace_file_link, content)
-        return content
+            # Create document (all as root first)
+            try:
+                document = self.create_document(title, content)
+                self._log_event(rel_str, 'document', 'success', 'Document created', {'id': document['id']})
+            except requests.exceptions.RequestException as e:
+                status_code = getattr(e.response, "status_code", "?")
+                if status_code in (401, 403):
+                    self._auth_failed = True
+                self._log_event(rel_str, 'document', 'failed', f'documents.create failed: {status_code}', {})
+                raise
+
+            # Store mapping for crosslink updates
+            with self._document_lock:
+                self._register_document(rel_str, document['id'])
+
+            # Keep the created text for the crosslink pass instead of fetching it back;
+            # only text with an absolute link ("](/...") can have crosslinks to rewrite
+            text = document.get('text', content)
+            if '](/' in text:
+                self._created_text[rel_str] = text
+
+            logger.debug("  ✓ Created: %s (ID: %s)", title, document['id'])
+            return document['id']
 
-    def migrate(self):
-        """Perform the complete migration"""
-        print("Starting WikiJS to Outline migration...")
+        except Exception as e:
+            self._log_event(rel_str, 'document', 'failed', f'processing failed: {e}', {})
+            logger.warning("  ✗ Failed to process %s: %s", relative_path, e)
+            return None
 
-        # Create or get collection
-        collections = self.get_collections()
-        print(f"Found {len(collections)} collections")
+    def _update_crosslinks_for_file(self, md_file: MarkdownFile):
+        """Rewrite the crosslinks of one created document (third migration pass)"""
+        relative_path, rel_str = md_file.rel, md_file.rel_str
+        doc_id = self.document_map.get(rel_str)
+        text = self._created_text.pop(rel_str, None)
 
-        wiki_collection = None
+        if not doc_id or text is None:
+            return
 
-        for collection in collections:
-            if collection['name'] == 'WikiJS Import':
-                wiki_collection = collection
-                break
+        try:
+            # Update crosslinks
+            updated_content = self.update_crosslinks(text)
+
+            if updated_content != text:
+                # Update document
+                update_data = {
+                    'id': doc_id,
+                    'text': updated_content
+                }
+                self._write_rate_limiter.acquire()
+                response = self.session.post(f'{self.outline_url}/api/documents.update',
+                                             json=update_data, timeout=HTTP_TIMEOUT)
+                if response.status_code == 200:
+                    self._log_event(rel_str, 'crosslinks', 'success', 'Crosslinks updated', {})
+                else:
+                    self._log_event(rel_str, 'crosslinks', 'failed', f'documents.update failed: {response.status_code}', {})
+                response.raise_for_status()
+                logger.debug("  ✓ Updated crosslinks in: %s", relative_path)
 
-        if not wiki_collection:
-            print("Creating new collection 'WikiJS Import'...")
-            self.collection_id = self.create_collection('WikiJS Import', 'Migrated from WikiJS')
-            print(f"Created collection with ID: {self.collection_id}")
-        else:
-            self.collection_id = wiki_collection['id']
-            print(f"Using existing collection: {wiki_collection['name']} (ID: {self.collection_id})")
+        except Exception as e:
+            self._log_event(rel_str, 'crosslinks', 'failed', f'crosslinks update failed: {e}', {})
+            logger.warning("  ✗ Failed to update crosslinks in %s: %s", relative_path, e)
 
-        # Test document creation permission
+    def check_document_permission(self):
+        """Create and delete a test document to check the token may create documents"""
         print("Testing document creation permission...")
         try:
             test_doc = self.create_document("_TEST_DOC_DELETE_ME", "Test content")
@@ -817,7 +1382,7 @@ class WikiJSToOutlineConverter:
 
             # Delete test document
             delete_response = self.session.post(f'{self.outline_url}/api/documents.delete',
-                                              json={'id': test_doc['id']})
+                                              json={'id': test_doc['id']}, timeout=HTTP_TIMEOUT)
             if delete_response.status_code == 200:
                 print("✓ Test document deleted")
             else:
@@ -830,7 +1395,7 @@ class WikiJSToOutlineConverter:
             # Get collection info to check permissions
             try:
                 coll_response = self.session.post(f'{self.outline_url}/api/collections.info',
-                                                json={'id': self.collection_id})
+                                                json={'id': self.collection_id}, timeout=HTTP_TIMEOUT)
                 coll_data = coll_response.json()['data']
                 print(f"Collection permissions: {coll_data.get('permission', 'unknown')}")
             except Exception as perm_e:
@@ -838,122 +1403,98 @@ class WikiJSToOutlineConverter:
 
             raise Exception("Cannot create documents - check token permissions")
 
-        # Get all markdown files in hierarchy order
-        md_files = self.get_page_hierarchy()
-        print(f"Found {len(md_files)} markdown files to migrate")
-
-        # Process each file
-        for file_path, _ in md_files:
-            relative_path = file_path.relative_to(self.wiki_dir)
-            rel_str = str(relative_path)
-            print(f"Processing: {relative_path}")
-
-            try:
-                # Parse the markdown file
-                frontmatter, content = self.parse_markdown_file(file_path)
-
-                # Get title from frontmatter or filename
-                title = frontmatter.get('title', file_path.stem.replace('_', ' ').title())
-
-                # Convert WikiJS block extensions to Outline callouts
-                content = self.convert_wikijs_blocks(content)
-
-                # Update image links
-                content = self.update_image_links(content, file_path)
-
-                # Update file links (non-images)
-                content = self.update_file_links(content, file_path)
-
-                # Create document (all as root first)
-                try:
-                    document = self.create_document(title, content)
-                    self._log_event(rel_str, 'document', 'success', 'Document created', {'id': document['id']})
-                except requests.exceptions.RequestException as e:
-                    self._log_event(rel_str, 'document', 'failed', f'documents.create failed: {getattr(e.response, "status_code", "?")}', {})
-                    raise
-
-                # Store mapping for crosslink updates
-                self.document_map[rel_str] = document['id']
-                self.url_map[f"/en/{relative_path.with_suffix('').as_posix()}"] = f"/doc/{document['id']}"
+    def migrate(self, skip_precheck: bool = False):
+        """Perform the complete migration"""
+        print("Starting WikiJS to Outline migration...")
 
-                print(f"  ✓ Created: {title} (ID: {document['id']})")
+        # Create or get collection
+        collections = self.get_collections()
+        print(f"Found {len(collections)} collections")
 
-                # Rate limiting
-                time.sleep(RATE_LIMIT_SLEEP_CREATE)
+        # The first collection of each name wins, as a scan of the list would
+        collections_by_name = {}
+        for collection in collections:
+            collections_by_name.setdefault(collection['name'], collection)
+        wiki_collection = collections_by_name.get('WikiJS Import')
 
-            except Exception as e:
-                self._log_event(rel_str, 'document', 'failed', f'processing failed: {e}', {})
-                print(f"  ✗ Failed to process {relative_path}: {e}")
+        if not wiki_collection:
+            print("Creating new collection 'WikiJS Import'...")
+            self.collection_id = self.create_collection('WikiJS Import', 'Migrated from WikiJS')
+            print(f"Created collection with ID: {self.collection_id}")
+        else:
+            self.collection_id = wiki_collection['id']
+            print(f"Using existing collection: {wiki_collection['name']} (ID: {self.collection_id})")
 
-        # Second pass: Build WikiJS tree structure and organize hierarchy
-        print("\nBuilding WikiJS tree structure...")
-        wiki_tree = self.build_wiki_tree()
+        # Test document creation permission, unless this token already passed it
+        # for this collection
+        precheck = {'token': self._token_fingerprint, 'collection_id': self.collection_id}
+        if skip_precheck:
+            print("Skipping document creation permission test")
+        elif self._load_cache().get('precheck') == precheck:
+            print("Document creation permission already verified for this token")
+        else:
+            self.check_document_permission()
+            self._save_cache({'precheck': precheck})
 
-        print("Organizing document hierarchy...")
+        # Get all markdown files in hierarchy order
+        md_files = self.get_page_hierarchy()
+        print(f"Found {len(md_files)} markdown files to migrate")
 
-        for file_path, _ in md_files:
-            relative_path = file_path.relative_to(self.wiki_dir)
-            doc_id = self.document_map.get(str(relative_path))
+        # Process each file. Every document is created at the collection root and
+        # moved below its parent later, so documents of one depth are independent;
+        # depths are still processed in order to keep parents ahead of children.
+        # Root documents are never moved and Outline lists them in the order they
+        # were created, so depth 0 is created sequentially in hierarchy order.
+        # Outline's bulk import (collections.import) runs as an asynchronous file
+        # operation that does not report the created document IDs, which the
+        # move and crosslink passes need, so documents are created one by one
+        depth_buckets: Dict[int, List[MarkdownFile]] = defaultdict(list)
+        for md_file in md_files:
+            depth_buckets[md_file.depth].append(md_file)
+
+        created = 0
+        with ThreadPoolExecutor(max_workers=MIGRATION_WORKERS) as executor:
+            for depth in sorted(depth_buckets):
+                if depth == 0:
+                    created += sum(1 for md_file in depth_buckets[depth] if self._create_from_file(md_file))
+                    continue
+                futures = [executor.submit(self._create_from_file, md_file) for md_file in depth_buckets[depth]]
+                created += sum(1 for future in as_completed(futures) if future.result())
+        print(f"Created {created} of {len(md_files)} documents")
+        if self._auth_failed:
+            # The token lost its permissions since the check was cached; test again next run
+            self._save_cache(None)
+
+        # Second pass: organize hierarchy
+        print("\nOrganizing document hierarchy...")
+
+        for md_file in md_files:
+            relative_path = md_file.rel
+            doc_id = self.document_map.get(md_file.rel_str)
 
             if not doc_id:
                 continue
 
-            # Get parent document ID using tree structure
-            parent_id = self.get_parent_from_tree(file_path, wiki_tree)
+            # Get parent document ID from the directory path
+            parent_id = self.get_parent_document_id(md_file)
 
-            if parent_id and parent_id in self.document_map.values():
-                print(f"  Moving '{relative_path}' under parent")
+            # Parents are always registered in document_map, no need to search its values
+            if parent_id:
+                logger.debug("  Moving '%s' under parent", relative_path)
                 success = self.move_document(doc_id, parent_id)
                 if success:
-                    self._log_event(str(relative_path), 'move', 'success', 'Document moved under parent', {'id': doc_id})
-                    print(f"    ✓ Moved successfully")
+                    self._log_event(md_file.rel_str, 'move', 'success', 'Document moved under parent', {'id': doc_id})
+                    logger.debug("    ✓ Moved successfully")
                 else:
-                    self._log_event(str(relative_path), 'move', 'failed', 'Move failed', {'id': doc_id})
-                    print(f"    ✗ Move failed")
-
-                time.sleep(RATE_LIMIT_SLEEP_MOVE)
+                    self._log_event(md_file.rel_str, 'move', 'failed', 'Move failed', {'id': doc_id})
+                    logger.warning("    ✗ Move failed: %s", relative_path)
 
         # Third pass: Update all crosslinks
         print("\nUpdating crosslinks...")
 
-        for file_path, _ in md_files:
-            relative_path = file_path.relative_to(self.wiki_dir)
-            rel_str = str(relative_path)
-            doc_id = self.document_map.get(rel_str)
-
-            if not doc_id:
-                continue
-
-            try:
-                # Get current document content
-                response = self.session.post(f'{self.outline_url}/api/documents.info',
-                                           json={'id': doc_id})
-                response.raise_for_status()
-                document = response.json()['data']
-
-                # Update crosslinks
-                updated_content = self.update_crosslinks(document['text'])
-
-                if updated_content != document['text']:
-                    # Update document
-                    update_data = {
-                        'id': doc_id,
-                        'text': updated_content
-                    }
-                    response = self.session.post(f'{self.outline_url}/api/documents.update',
-                                               json=update_data)
-                    if response.status_code == 200:
-                        self._log_event(str(relative_path), 'crosslinks', 'success', 'Crosslinks updated', {})
-                    else:
-                        self._log_event(str(relative_path), 'crosslinks', 'failed', f'documents.update failed: {response.status_code}', {})
-                    response.raise_for_status()
-                    print(f"  ✓ Updated crosslinks in: {relative_path}")
-
-                time.sleep(RATE_LIMIT_SLEEP_UPDATE)
-
-            except Exception as e:
-                self._log_event(rel_str, 'crosslinks', 'failed', f'crosslinks update failed: {e}', {})
-                print(f"  ✗ Failed to update crosslinks in {relative_path}: {e}")
+        # Documents are updated independently of each other
+        with ThreadPoolExecutor(max_workers=MIGRATION_WORKERS) as executor:
+            list(executor.map(self._update_crosslinks_for_file, md_files))
 
         print(f"\nMigration completed! Processed {len(md_files)} documents.")
         print(f"Collection ID: {self.collection_id}")
@@ -967,11 +1508,17 @@ def main():
     parser.add_argument('--outline-url', required=True, help='Outline instance URL')
     parser.add_argument('--token', required=True, help='Outline API token')
     parser.add_argument('--wiki-dir', default='wikijs-complete-export', required=True, help='WikiJS backup directory')
+    parser.add_argument('--skip-precheck', action='store_true', help='Skip creating and deleting a test document before the migration')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every document, image, file link and block conversion')
 
     args = parser.parse_args()
 
+    # Per-document progress is logged at DEBUG level and only shown with --verbose
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
     converter = WikiJSToOutlineConverter(args.outline_url, args.token, args.wiki_dir)
-    converter.migrate()
+    converter.migrate(skip_precheck=args.skip_precheck)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file